@@ -0,0 +1,57 @@
+"""
+JSON codec benchmark on orderbook traffic: stdlib json vs pybybit.util.codec, and DataStore.onmessage
+
+    python benchmarks/bench_codec.py [frames.jsonl]
+
+frames.jsonl holds one recorded WebSocket frame per line. Without it, orderBook_200.100ms frames are synthesized.
+"""
+
+import json
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+from pybybit.util import codec
+from pybybit.util.store import DataStore
+
+def synthesize(n: int=2000, symbol: str='BTCUSD') -> list:
+    rnd = random.Random(0)
+    def level(price: float, side: str) -> dict:
+        return {'price': f'{price:.2f}', 'symbol': symbol, 'id': int(price * 10000), 'side': side, 'size': rnd.randint(1, 100000)}
+    book = [level(35000.0 - i * 0.5, 'Buy') for i in range(200)] + [level(35000.5 + i * 0.5, 'Sell') for i in range(200)]
+    frames = [json.dumps({'topic': f'orderBook_200.100ms.{symbol}', 'type': 'snapshot', 'data': book, 'cross_seq': 0, 'timestamp_e6': 0})]
+    for seq in range(1, n):
+        update = [dict(rnd.choice(book), size=rnd.randint(1, 100000)) for _ in range(rnd.randint(1, 8))]
+        data = {'delete': [], 'update': update, 'insert': []}
+        frames.append(json.dumps({'topic': f'orderBook_200.100ms.{symbol}', 'type': 'delta', 'data': data, 'cross_seq': seq, 'timestamp_e6': seq}))
+    return frames
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            frames = [line.rstrip('\n') for line in f if line.strip()]
+    else:
+        frames = synthesize()
+    frames_b = [f.encode() for f in frames]
+    nbytes = sum(len(b) for b in frames_b)
+    print(f'{len(frames)} frames, {nbytes / 1024:.0f} KiB, accelerated={codec.orjson is not None}')
+
+    def run(name: str, func) -> None:
+        t = min(timeit.repeat(func, number=5, repeat=3)) / 5
+        print(f'{name:28} {t * 1e3:8.2f} ms  {len(frames) / t:12.0f} frames/s')
+
+    run('json.loads(str)', lambda: [json.loads(f) for f in frames])
+    run('json.loads(bytes.decode())', lambda: [json.loads(b.decode()) for b in frames_b])
+    run('codec.loads(str)', lambda: [codec.loads(f) for f in frames])
+    run('codec.loads(bytes)', lambda: [codec.loads(b) for b in frames_b])
+
+    def store(msgs: list) -> None:
+        s = DataStore()
+        for m in msgs:
+            s.onmessage(m, None)
+    run('DataStore.onmessage(str)', lambda: store(frames))
+    run('DataStore.onmessage(bytes)', lambda: store(frames_b))
+
+if __name__ == '__main__':
+    main()
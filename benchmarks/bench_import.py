@@ -0,0 +1,63 @@
+"""
+Import-time benchmark and regression guard for the pybybit package
+
+    python benchmarks/bench_import.py [runs] [budget_ms]
+
+Exits non-zero when a statement pulls in a module it should load lazily, or when
+'import pybybit' exceeds the budget (median over fresh interpreters).
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    # statement, modules that must NOT be imported afterwards
+    ('import pybybit', ['requests', 'websocket', 'aiohttp', 'asyncio', 'pybybit.rest', 'pybybit.ws', 'pybybit.util.store']),
+    ('from pybybit import DataStore', ['requests', 'websocket', 'aiohttp', 'pybybit.rest', 'pybybit.ws']),
+    ('from pybybit.util.auth import Authentication', ['requests', 'websocket', 'aiohttp', 'asyncio', 'pybybit.rest']),
+    ('from pybybit import API', ['requests', 'websocket', 'aiohttp', 'pybybit.rest', 'pybybit.ws']),
+    ('from pybybit import RESTAPI', ['websocket', 'aiohttp']),
+]
+
+PROBE = '''
+import sys, time
+t = time.perf_counter()
+{stmt}
+t = time.perf_counter() - t
+print(t * 1000)
+print(','.join(m for m in {forbidden!r} if m in sys.modules))
+'''
+
+def probe(stmt: str, forbidden: list) -> tuple:
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE.format(stmt=stmt, forbidden=forbidden)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+    return float(out[0]), [m for m in out[1].split(',') if m]
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    failed = False
+    for stmt, forbidden in CASES:
+        samples = []
+        for _ in range(runs):
+            ms, loaded = probe(stmt, forbidden)
+            samples.append(ms)
+        median = statistics.median(samples)
+        status = 'ok'
+        if loaded:
+            status = f"FAIL eagerly loaded: {', '.join(loaded)}"
+            failed = True
+        elif stmt == 'import pybybit' and median > budget:
+            status = f'FAIL over budget ({budget:.1f} ms)'
+            failed = True
+        print(f'{stmt:48} median {median:8.2f} ms  min {min(samples):8.2f} ms  {status}')
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
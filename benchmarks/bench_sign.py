@@ -0,0 +1,63 @@
+"""
+Signing microbenchmark: legacy private request signing path vs Authentication._query
+
+    python benchmarks/bench_sign.py [number]
+"""
+
+import hashlib
+import hmac
+import re
+import sys
+import time
+import timeit
+
+sys.path.insert(0, '.')
+from pybybit.util.auth import Authentication
+
+KEY = 'B2Rou0PLPpGqcU0Vu2'
+SECRET = 't7T0YlFnYXk0Fx3JswQsDrViLg1Gh3DUU5Mr'
+PAYLOADS = {
+    'limit': {
+        'side': 'Buy', 'symbol': 'BTCUSD', 'order_type': 'Limit', 'qty': 100, 'price': 35000.5,
+        'time_in_force': 'PostOnly', 'take_profit': None, 'stop_loss': None, 'tp_trigger_by': None,
+        'sl_trigger_by': None, 'reduce_only': None, 'close_on_trigger': None, 'order_link_id': None,
+    },
+    'full': {
+        'side': 'Sell', 'symbol': 'BTCUSDT', 'order_type': 'Limit', 'qty': 0.01, 'price': 35000.5,
+        'time_in_force': 'GoodTillCancel', 'take_profit': 30000, 'stop_loss': 40000, 'tp_trigger_by': 'LastPrice',
+        'sl_trigger_by': 'LastPrice', 'reduce_only': False, 'close_on_trigger': False, 'order_link_id': 'bench-0001',
+    },
+}
+
+def legacy(secret: bytes, key: str, query: dict) -> str:
+    for k in list(query):
+        if query[k] is None:
+            del query[k]
+    auth_args = {'api_key': key, 'timestamp': int(time.time() * 1000)}
+    query = dict(sorted({**query, **auth_args}.items()))
+    query_str = '&'.join(f'{k}={v}' for k, v in query.items())
+    hexdigest = hmac.new(secret, query_str.encode(), hashlib.sha256).hexdigest()
+    return query_str + f'&sign={hexdigest}'
+
+def engine(auth: Authentication, query: dict) -> str:
+    query = {k: v for k, v in query.items() if v is not None}
+    return auth._query(query)
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    auth = Authentication(KEY, SECRET)
+    for name, payload in PAYLOADS.items():
+        # both paths must produce the same string modulo the timestamp/signature
+        a = re.sub(r'&(timestamp|sign)=\w+', '', legacy(SECRET.encode(), KEY, dict(payload)))
+        b = re.sub(r'&(timestamp|sign)=\w+', '', engine(auth, dict(payload)))
+        assert a == b, (a, b)
+        t_legacy = min(timeit.repeat(lambda: legacy(SECRET.encode(), KEY, dict(payload)), number=number, repeat=3))
+        t_engine = min(timeit.repeat(lambda: engine(auth, dict(payload)), number=number, repeat=3))
+        print(
+            f'{name:6} legacy {t_legacy / number * 1e6:7.2f} us/op'
+            f'  engine {t_engine / number * 1e6:7.2f} us/op'
+            f'  x{t_legacy / t_engine:.2f}'
+        )
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,34 @@ pybybit - Bybit API client library for Python
 
 """
 
-from .api import API
-from .rest import RESTAPI
-from .ws import WebScoketAPI
-from .util.store import DataStore
+import importlib
 
 __VERSION__ = '2.0.4'
 __API_VERSION__ = '2021-06-18'
+
+# submodules (and requests/websocket behind them) are imported on first attribute access
+_LAZY = {
+    'API': '.api',
+    'AsyncAPI': '.api',
+    'RESTAPI': '.rest',
+    'WebScoketAPI': '.ws',
+    'DataStore': '.util.store',
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    # submodules (pybybit.rest, pybybit.util, ...) resolve as they did when imported eagerly
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,132 @@
+import asyncio
+import datetime
+import functools
+import time
+import aiohttp
+import requests
+from typing import Tuple
+from requests.structures import CaseInsensitiveDict
+from .rest import RESTAPI
+from .util.bulk import CANCEL, CREATE, REPLACE, BulkResult, BulkResults, _reflect, _result
+from .util.dispatch import AsyncDispatcher
+
+class AsyncRESTAPI(RESTAPI):
+    _LIMIT = 100
+
+    def __init__(self, auth, testnet, limit: int=_LIMIT):
+        self._limit = limit
+        super().__init__(auth, testnet)
+        self.dispatcher: AsyncDispatcher = None
+
+    def _newsession(self) -> None:
+        # the aiohttp session must be created inside the running loop: see _getsession
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def _getsession(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @staticmethod
+    def _response(req_args: dict, status: int, reason: str, headers, url: str, content: bytes) -> requests.Response:
+        request = requests.Request(**req_args).prepare()
+        resp = requests.Response()
+        resp.status_code = status
+        resp.reason = reason
+        resp.headers = CaseInsensitiveDict({str(k): v for k, v in headers.items()})
+        resp.url = url
+        resp.request = request
+        resp._content = content
+        resp.encoding = 'utf-8'
+        return resp
+
+    async def _fetch(self, session: aiohttp.ClientSession, req_args: dict) -> Tuple[requests.Response, float]:
+        t = time.perf_counter()
+        if self.transport is not None:
+            resp = await self.transport.request_async(**req_args)
+            return resp, time.perf_counter() - t
+        async with session.request(**req_args) as r:
+            ttfb = time.perf_counter() - t
+            content = await r.read()
+            resp = self._response(req_args, r.status, r.reason, r.headers, str(r.url), content)
+            # same meaning as requests: time until the response headers arrived
+            resp.elapsed = datetime.timedelta(seconds=ttfb)
+            return resp, ttfb
+
+    async def _request(self, method: str, path: str, query: dict, private: bool) -> requests.Response:
+        if self.cache is not None and not private:
+            key = self.cache.key(method, path, query)
+            if key is not None:
+                return await self.cache.fetch_async(key, functools.partial(self._send, method, path, query, private))
+        return await self._send(method, path, query, private)
+
+    async def _send(self, method: str, path: str, query: dict, private: bool) -> requests.Response:
+        t0 = time.perf_counter()
+        if self.ratelimiter is not None:
+            await self.ratelimiter.acquire_async(method, path)
+        t1 = time.perf_counter()
+        req_args = self._prepare(method, self._url + path, query, private)
+        session = self._getsession()
+        t2 = time.perf_counter()
+        if self.hedge is not None and self.hedge.eligible(method, path, private):
+            resp, ttfb = await self.hedge.request_async(path, functools.partial(self._fetch, session, req_args))
+        else:
+            resp, ttfb = await self._fetch(session, req_args)
+        self._received(method, path, resp, session, (t0, t1, t2), ttfb)
+        return resp
+
+    async def flush(self) -> None:
+        if self.dispatcher is not None:
+            await self.dispatcher.flush()
+
+    async def close(self) -> None:
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def initialize_request_inverse(self, symbol: str):
+        return await asyncio.gather(*super().initialize_request_inverse(symbol))
+
+    async def initialize_request_linear(self, symbol: str):
+        return await asyncio.gather(*super().initialize_request_linear(symbol))
+
+    async def initialize_request_futures(self, symbol: str):
+        return await asyncio.gather(*super().initialize_request_futures(symbol))
+
+    async def initialize_request(self, inverse: list=(), linear: list=(), futures: list=(), max_workers: int=8) -> list:
+        semaphore = asyncio.Semaphore(max_workers)
+        async def call(func, kwargs):
+            async with semaphore:
+                return await func(**kwargs)
+        calls = self._initialize_calls(inverse, linear, futures)
+        return await asyncio.gather(*(call(func, kwargs) for func, kwargs in calls))
+
+    async def bulk_order(self, calls: list, store=None, max_workers: int=10) -> BulkResults:
+        semaphore = asyncio.Semaphore(max_workers)
+        async def call(func, spec, action):
+            async with semaphore:
+                try:
+                    result = _result(spec, await func(**spec))
+                except Exception as e:
+                    return BulkResult(spec, None, None, e)
+            _reflect(store, result, action)
+            return result
+        return BulkResults(await asyncio.gather(*(call(func, spec, action) for func, spec, action in calls)))
+
+    async def bulk_order_create(self, func, orders: list, store=None, max_workers: int=10) -> BulkResults:
+        return await self.bulk_order([(func, spec, CREATE) for spec in orders], store, max_workers)
+
+    async def bulk_order_cancel(self, func, orders: list, store=None, max_workers: int=10) -> BulkResults:
+        return await self.bulk_order([(func, spec, CANCEL) for spec in orders], store, max_workers)
+
+    async def bulk_order_replace(self, func, orders: list, store=None, max_workers: int=10) -> BulkResults:
+        return await self.bulk_order([(func, spec, REPLACE) for spec in orders], store, max_workers)
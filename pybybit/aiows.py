@@ -0,0 +1,136 @@
+import asyncio
+import time
+from typing import AsyncIterator, List, Optional, Union
+import aiohttp
+from .util import codec
+from .util.dedup import Deduplicator
+from .ws import Connection, WebScoketAPI
+
+class AsyncWebSocketAPI(WebScoketAPI):
+    """
+    asyncio counterpart of WebScoketAPI: run_forever_* return Tasks on the running loop,
+    callbacks may be coroutine functions, and messages() iterates frames asynchronously
+    """
+
+    def __init__(self, auth, testnet) -> None:
+        super().__init__(auth, testnet)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tasks: List[asyncio.Task] = []
+        self._queues: List[asyncio.Queue] = []
+        self.dropped = 0
+
+    def _getsession(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _heartbeat(self, ws: aiohttp.ClientWebSocketResponse, conn: Connection) -> None:
+        while True:
+            await asyncio.sleep(min(self.ping_interval, self._TICK_SEC))
+            if conn._stale(self.pong_timeout, self.stale_after) is not None:
+                conn.stale += 1
+                await ws.close()
+                break
+            if time.time() - conn.ping_last >= self.ping_interval:
+                conn._onping()
+                try:
+                    await ws.send_str('{"op":"ping"}')
+                except Exception:
+                    break
+
+    async def _dispatch(self, msg: Union[str, bytes], ws: aiohttp.ClientWebSocketResponse) -> None:
+        for cb in self._callbacks:
+            try:
+                r = cb(msg, ws)
+                if asyncio.iscoroutine(r):
+                    await r
+            except Exception as e:
+                self.errors += 1
+                self.exception = e
+        for queue in self._queues:
+            if queue.full():
+                # a slow messages() consumer loses its oldest frame instead of stalling recv
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(msg)
+
+    async def _onmessage(self, ws: aiohttp.ClientWebSocketResponse, conn: Connection) -> None:
+        heartbeat = asyncio.ensure_future(self._heartbeat(ws, conn))
+        try:
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    data = msg.data
+                    if self.binary and isinstance(data, str):
+                        data = data.encode()
+                    conn._onmessage(data)
+                    if conn.dedup is not None:
+                        data = conn.dedup._filter(data, conn)
+                        if data is None:
+                            continue
+                    if self.decode:
+                        data = codec.Message(data)
+                    await self._dispatch(data, ws)
+                elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED, ):
+                    break
+        finally:
+            heartbeat.cancel()
+
+    async def _loop(self, wsurl: str, topics: list, dedup: Deduplicator=None) -> None:
+        policy = self.reconnect_policy()
+        conn = Connection(wsurl, topics, dedup)
+        self.connections.append(conn)
+        while True:
+            t = time.time()
+            try:
+                async with self._getsession().ws_connect(self._url(wsurl, topics)) as ws:
+                    await ws.send_str(self._command('subscribe', topics))
+                    conn._onconnect()
+                    if conn.connects > 1:
+                        for cb in self._reconnect_callbacks:
+                            try:
+                                r = cb(topics, ws)
+                                if asyncio.iscoroutine(r):
+                                    await r
+                            except Exception as e:
+                                self.errors += 1
+                                self.exception = e
+                    await self._onmessage(ws, conn)
+            except Exception:
+                pass
+            conn.connected = False
+            await asyncio.sleep(policy.delay(time.time() - t))
+
+    def _run(self, wsurl: str, topics: list, dedup: Deduplicator=None) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(self._loop(wsurl, topics, dedup))
+        self._tasks.append(task)
+        return task
+
+    def run_forever_inverse(self, topics: list, dedup: Deduplicator=None) -> asyncio.Task:
+        wsurl = self._MAINNET_INVERSE if not self._testnet else self._TESTNET_INVERSE
+        return self._run(wsurl, topics, dedup)
+
+    def run_forever_linear_public(self, topics: list, dedup: Deduplicator=None) -> asyncio.Task:
+        wsurl = self._MAINNET_LINEAR_PUBLIC if not self._testnet else self._TESTNET_LINEAR_PUBLIC
+        return self._run(wsurl, topics, dedup)
+
+    def run_forever_linear_private(self, topics: list, dedup: Deduplicator=None) -> asyncio.Task:
+        wsurl = self._MAINNET_LINEAR_PRIVATE if not self._testnet else self._TESTNET_LINEAR_PRIVATE
+        return self._run(wsurl, topics, dedup)
+
+    async def messages(self, maxsize: int=0) -> AsyncIterator[Union[str, bytes, codec.Message]]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
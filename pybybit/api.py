@@ -1,9 +1,19 @@
-from .rest import RESTAPI
-from .ws import WebScoketAPI
 from .util.auth import Authentication
 
 class API:
     def __init__(self, key: str='', secret: str='', testnet: bool=False):
+        from .rest import RESTAPI
+        from .ws import WebScoketAPI
         auth = Authentication(key, secret)
         self.rest = RESTAPI(auth, testnet)
+        self.clock = auth._clock
         self.ws = WebScoketAPI(auth, testnet)
+
+class AsyncAPI:
+    def __init__(self, key: str='', secret: str='', testnet: bool=False):
+        from .aiorest import AsyncRESTAPI # requires aiohttp
+        from .aiows import AsyncWebSocketAPI
+        auth = Authentication(key, secret)
+        self.rest = AsyncRESTAPI(auth, testnet)
+        self.clock = auth._clock
+        self.ws = AsyncWebSocketAPI(auth, testnet)
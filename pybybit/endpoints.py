@@ -0,0 +1,149 @@
+# ENDPOINTS generated by util/bybit_doc_scraping.py; RESULTS below is hand-maintained
+# (name, http method, path, private, ((param, type), ...), description)
+
+ENDPOINTS = {
+    'Inverse': (
+        ('public_orderbook_l2', 'GET', '/v2/public/orderBook/L2', False, (('symbol', 'str'),), 'Order book'),
+        ('public_kline_list', 'GET', '/v2/public/kline/list', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Kline'),
+        ('public_tickers', 'GET', '/v2/public/tickers', False, (('symbol', 'str'),), 'Latest Information for Symbol'),
+        ('public_tradingrecords', 'GET', '/v2/public/trading-records', False, (('symbol', 'str'), ('from', 'int'), ('limit', 'int')), 'Public Trading Records'),
+        ('public_symbols', 'GET', '/v2/public/symbols', False, (), 'Query Symbol'),
+        ('public_liqrecords', 'GET', '/v2/public/liq-records', False, (('symbol', 'str'), ('from', 'int'), ('limit', 'int'), ('start_time', 'int'), ('end_time', 'int')), 'Liquidated Orders'),
+        ('public_markpricekline', 'GET', '/v2/public/mark-price-kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Mark Price Kline'),
+        ('public_indexpricekline', 'GET', '/v2/public/index-price-kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Index Price Kline'),
+        ('public_premiumindexkline', 'GET', '/v2/public/premium-index-kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Premium Index Kline'),
+        ('public_openinterest', 'GET', '/v2/public/open-interest', False, (('symbol', 'str'), ('period', 'str'), ('limit', 'int')), 'Open Interest'),
+        ('public_bigdeal', 'GET', '/v2/public/big-deal', False, (('symbol', 'str'), ('limit', 'int')), 'Latest Big Deal'),
+        ('public_accountratio', 'GET', '/v2/public/account-ratio', False, (('symbol', 'str'), ('period', 'str'), ('limit', 'int')), 'Long-Short Ratio'),
+        ('private_order_create', 'POST', '/v2/private/order/create', True, (('side', 'str'), ('symbol', 'str'), ('order_type', 'str'), ('qty', 'int'), ('price', 'float'), ('time_in_force', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('order_link_id', 'str')), 'Place Active Order'),
+        ('private_order_list', 'GET', '/v2/private/order/list', True, (('symbol', 'str'), ('order_status', 'str'), ('direction', 'str'), ('limit', 'int'), ('cursor', 'str')), 'Get Active Order'),
+        ('private_order_cancel', 'POST', '/v2/private/order/cancel', True, (('symbol', 'str'), ('order_id', 'str'), ('order_link_id', 'str')), 'Cancel Active Order'),
+        ('private_order_cancelall', 'POST', '/v2/private/order/cancelAll', True, (('symbol', 'str'),), 'Cancel All Active Orders'),
+        ('private_order_replace', 'POST', '/v2/private/order/replace', True, (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('p_r_qty', 'str'), ('p_r_price', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Replace Active Order'),
+        ('private_order', 'GET', '/v2/private/order', True, (('symbol', 'str'), ('order_id', 'str'), ('order_link_id', 'str')), 'Query Active Order (real-time)'),
+        ('private_stoporder_create', 'POST', '/v2/private/stop-order/create', True, (('side', 'str'), ('symbol', 'str'), ('order_type', 'str'), ('qty', 'str'), ('price', 'str'), ('base_price', 'str'), ('stop_px', 'str'), ('time_in_force', 'str'), ('trigger_by', 'str'), ('close_on_trigger', 'bool'), ('order_link_id', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Place Conditional Order'),
+        ('private_stoporder_list', 'GET', '/v2/private/stop-order/list', True, (('symbol', 'str'), ('stop_order_status', 'str'), ('direction', 'str'), ('limit', 'int'), ('cursor', 'str')), 'Get Conditional Order'),
+        ('private_stoporder_cancel', 'POST', '/v2/private/stop-order/cancel', True, (('symbol', 'str'), ('stop_order_id', 'str'), ('order_link_id', 'str')), 'Cancel Conditional Order'),
+        ('private_stoporder_cancelall', 'POST', '/v2/private/stop-order/cancelAll', True, (('symbol', 'str'),), 'Cancel All Conditional Orders'),
+        ('private_stoporder_replace', 'POST', '/v2/private/stop-order/replace', True, (('stop_order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('p_r_qty', 'int'), ('p_r_price', 'str'), ('p_r_trigger_price', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Replace Conditional Order'),
+        ('private_stoporder', 'GET', '/v2/private/stop-order', True, (('symbol', 'str'), ('stop_order_id', 'str'), ('order_link_id', 'str')), 'Query Conditional Order (real-time)'),
+        ('private_position_list', 'GET', '/v2/private/position/list', True, (('symbol', 'str'),), 'My Position'),
+        ('private_position_changepositionmargin', 'POST', '/v2/private/position/change-position-margin', True, (('symbol', 'str'), ('margin', 'str')), 'Change Margin'),
+        ('private_position_tradingstop', 'POST', '/v2/private/position/trading-stop', True, (('symbol', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('trailing_stop', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str'), ('new_trailing_active', 'float'), ('sl_size', 'float'), ('tp_size', 'float')), 'Set Trading-Stop'),
+        ('private_position_leverage_save', 'POST', '/v2/private/position/leverage/save', True, (('symbol', 'str'), ('leverage', 'float')), 'Set Leverage'),
+        ('private_execution_list', 'GET', '/v2/private/execution/list', True, (('order_id', 'str'), ('symbol', 'str'), ('start_time', 'int'), ('page', 'int'), ('limit', 'int'), ('order', 'str')), 'User Trade Records'),
+        ('private_trade_closedpnl_list', 'GET', '/v2/private/trade/closed-pnl/list', True, (('symbol', 'str'), ('start_time', 'int'), ('end_time', 'int'), ('exec_type', 'str'), ('page', 'int'), ('limit', 'int')), 'Closed Profit and Loss'),
+        ('private_tpsl_switchmode', 'POST', '/v2/private/tpsl/switch-mode', True, (('symbol', 'str'), ('tp_sl_mode', 'str')), 'Full/Partial Position SL/TP Switch'),
+        ('private_position_switchisolated', 'POST', '/v2/private/position/switch-isolated', True, (('symbol', 'str'), ('is_isolated', 'bool'), ('buy_leverage', 'float'), ('sell_leverage', 'float')), 'Cross/Isolated Margin Switch'),
+        ('public_risklimit_list', 'GET', '/v2/public/risk-limit/list', False, (('symbol', 'str'),), 'Get Risk Limit'),
+        ('private_position_risklimit', 'POST', '/v2/private/position/risk-limit', True, (('symbol', 'str'), ('risk_id', 'int')), 'Set Risk Limit'),
+        ('public_funding_prevfundingrate', 'GET', '/v2/public/funding/prev-funding-rate', False, (('symbol', 'str'),), 'Get the Last Funding Rate'),
+        ('private_funding_prevfunding', 'GET', '/v2/private/funding/prev-funding', True, (('symbol', 'str'),), 'My Last Funding Fee'),
+        ('private_funding_predictedfunding', 'GET', '/v2/private/funding/predicted-funding', True, (('symbol', 'str'),), 'Predicted Funding Rate and My Funding Fee'),
+        ('private_account_apikey', 'GET', '/v2/private/account/api-key', True, (), 'API Key Info'),
+        ('private_account_lcp', 'GET', '/v2/private/account/lcp', True, (('symbol', 'str'),), 'LCP Info'),
+        ('private_wallet_balance', 'GET', '/v2/private/wallet/balance', True, (('coin', 'str'),), 'Get Wallet Balance'),
+        ('private_wallet_fund_records', 'GET', '/v2/private/wallet/fund/records', True, (('start_date', 'str'), ('end_date', 'str'), ('currency', 'str'), ('coin', 'str'), ('wallet_fund_type', 'str'), ('page', 'int'), ('limit', 'int')), 'Wallet Fund Records'),
+        ('private_wallet_withdraw_list', 'GET', '/v2/private/wallet/withdraw/list', True, (('start_date', 'str'), ('end_date', 'str'), ('coin', 'str'), ('status', 'str'), ('page', 'int'), ('limit', 'int')), 'Withdraw Records'),
+        ('private_exchangeorder_list', 'GET', '/v2/private/exchange-order/list', True, (('limit', 'int'), ('from', 'int'), ('direction', 'str')), 'Asset Exchange Records'),
+        ('public_time', 'GET', '/v2/public/time', False, (), 'Server Time'),
+        ('public_announcement', 'GET', '/v2/public/announcement', False, (), 'Announcement'),
+    ),
+    'Linear': (
+        ('public_kline', 'GET', '/public/linear/kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Kline'),
+        ('public_recenttradingrecords', 'GET', '/public/linear/recent-trading-records', False, (('symbol', 'str'), ('limit', 'int')), 'Public Trading Records'),
+        ('public_funding_prevfundingrate', 'GET', '/public/linear/funding/prev-funding-rate', False, (('symbol', 'str'),), 'Get the Last Funding Rate'),
+        ('public_markpricekline', 'GET', '/public/linear/mark-price-kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Mark Price Kline'),
+        ('public_indexpricekline', 'GET', '/public/linear/index-price-kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Index Price Kline'),
+        ('public_premiumindexkline', 'GET', '/public/linear/premium-index-kline', False, (('symbol', 'str'), ('interval', 'str'), ('from', 'int'), ('limit', 'int')), 'Query Premium Index Kline'),
+        ('private_order_create', 'POST', '/private/linear/order/create', True, (('side', 'str'), ('symbol', 'str'), ('order_type', 'str'), ('qty', 'float'), ('price', 'float'), ('time_in_force', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('order_link_id', 'str')), 'Place Active Order'),
+        ('private_order_list', 'GET', '/private/linear/order/list', True, (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('order', 'str'), ('page', 'int'), ('limit', 'int'), ('order_status', 'str')), 'Get Active Order'),
+        ('private_order_cancel', 'POST', '/private/linear/order/cancel', True, (('symbol', 'str'), ('order_id', 'str'), ('order_link_id', 'str')), 'Cancel Active Order'),
+        ('private_order_cancelall', 'POST', '/private/linear/order/cancel-all', True, (('symbol', 'str'),), 'Cancel All Active Orders'),
+        ('private_order_replace', 'POST', '/private/linear/order/replace', True, (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('p_r_qty', 'str'), ('p_r_price', 'float'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Replace Active Order'),
+        ('private_order_search', 'GET', '/private/linear/order/search', True, (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str')), 'Query Active Order (real-time)'),
+        ('private_stoporder_create', 'POST', '/private/linear/stop-order/create', True, (('side', 'str'), ('symbol', 'str'), ('order_type', 'str'), ('qty', 'float'), ('price', 'float'), ('base_price', 'float'), ('stop_px', 'float'), ('time_in_force', 'str'), ('trigger_by', 'str'), ('close_on_trigger', 'bool'), ('order_link_id', 'str'), ('reduce_only', 'bool'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Place Conditional Order'),
+        ('private_stoporder_list', 'GET', '/private/linear/stop-order/list', True, (('stop_order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('stop_order_status', 'str'), ('order', 'str'), ('page', 'int'), ('limit', 'int')), 'Get Conditional Order'),
+        ('private_stoporder_cancel', 'POST', '/private/linear/stop-order/cancel', True, (('symbol', 'str'), ('stop_order_id', 'str'), ('order_link_id', 'str')), 'Cancel Conditional Order'),
+        ('private_stoporder_cancelall', 'POST', '/private/linear/stop-order/cancel-all', True, (('symbol', 'str'),), 'Cancel All Conditional Orders'),
+        ('private_stoporder_replace', 'POST', '/private/linear/stop-order/replace', True, (('stop_order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('p_r_qty', 'str'), ('p_r_price', 'float'), ('p_r_trigger_price', 'float'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Replace Conditional Order'),
+        ('private_stoporder_search', 'GET', '/private/linear/stop-order/search', True, (('symbol', 'str'), ('stop_order_id', 'str'), ('order_link_id', 'str')), 'Query Conditional Order (real-time)'),
+        ('private_position_list', 'GET', '/private/linear/position/list', True, (('symbol', 'str'),), 'My Position'),
+        ('private_position_setautoaddmargin', 'POST', '/private/linear/position/set-auto-add-margin', True, (('symbol', 'str'), ('side', 'str'), ('auto_add_margin', 'bool')), 'Set Auto Add Margin'),
+        ('private_position_switchisolated', 'POST', '/private/linear/position/switch-isolated', True, (('symbol', 'str'), ('is_isolated', 'bool'), ('buy_leverage', 'float'), ('sell_leverage', 'float')), 'Cross/Isolated Margin Switch'),
+        ('private_tpsl_switchmode', 'POST', '/private/linear/tpsl/switch-mode', True, (('symbol', 'str'), ('tp_sl_mode', 'str')), 'Full/Partial Position SL/TP Switch'),
+        ('private_position_addmargin', 'POST', '/private/linear/position/add-margin', True, (('symbol', 'str'), ('side', 'str'), ('margin', 'float')), 'Add/Reduce Margin'),
+        ('private_position_setleverage', 'POST', '/private/linear/position/set-leverage', True, (('symbol', 'str'), ('buy_leverage', 'float'), ('sell_leverage', 'float')), 'Set Leverage'),
+        ('private_position_tradingstop', 'POST', '/private/linear/position/trading-stop', True, (('symbol', 'str'), ('side', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('trailing_stop', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str'), ('sl_size', 'float'), ('tp_size', 'float')), 'Set Trading-Stop'),
+        ('private_trade_execution_list', 'GET', '/private/linear/trade/execution/list', True, (('symbol', 'str'), ('start_time', 'int'), ('end_time', 'int'), ('exec_type', 'str'), ('page', 'int'), ('limit', 'int')), 'User Trade Records'),
+        ('private_trade_closedpnl_list', 'GET', '/private/linear/trade/closed-pnl/list', True, (('symbol', 'str'), ('start_time', 'int'), ('end_time', 'int'), ('exec_type', 'str'), ('page', 'int'), ('limit', 'int')), 'Closed Profit and Loss'),
+        ('public_risklimit', 'GET', '/public/linear/risk-limit', False, (('symbol', 'str'),), 'Get Risk Limit'),
+        ('private_position_setrisk', 'POST', '/private/linear/position/set-risk', True, (('symbol', 'str'), ('side', 'str'), ('risk_id', 'int')), 'Set Risk Limit'),
+        ('private_funding_predictedfunding', 'GET', '/private/linear/funding/predicted-funding', True, (('symbol', 'str'),), 'Predicted Funding Rate and My Funding Fee'),
+        ('private_funding_prevfunding', 'GET', '/private/linear/funding/prev-funding', True, (('symbol', 'str'),), 'My Last Funding Fee'),
+        ('public_time', 'GET', '/v2/public/time', False, (), 'Server Time'),
+        ('public_announcement', 'GET', '/v2/public/announcement', False, (), 'Announcement'),
+    ),
+    'Futures': (
+        ('private_order_create', 'POST', '/futures/private/order/create', True, (('position_idx', 'int'), ('side', 'str'), ('symbol', 'str'), ('order_type', 'str'), ('qty', 'int'), ('price', 'float'), ('time_in_force', 'str'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('order_link_id', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Place Active Order'),
+        ('private_order_list', 'GET', '/futures/private/order/list', True, (('symbol', 'str'), ('order_status', 'str'), ('direction', 'str'), ('limit', 'int'), ('cursor', 'str')), 'Get Active Order'),
+        ('private_order_cancel', 'POST', '/futures/private/order/cancel', True, (('symbol', 'str'), ('order_id', 'str'), ('order_link_id', 'str')), 'Cancel Active Order'),
+        ('private_order_cancelall', 'POST', '/futures/private/order/cancelAll', True, (('symbol', 'str'),), 'Cancel All Active Orders'),
+        ('private_order_replace', 'POST', '/futures/private/order/replace', True, (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('p_r_qty', 'str'), ('p_r_price', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Replace Active Order'),
+        ('private_order', 'GET', '/futures/private/order', True, (('symbol', 'str'), ('order_id', 'str'), ('order_link_id', 'str')), 'Query Active Order (real-time)'),
+        ('private_stoporder_create', 'POST', '/futures/private/stop-order/create', True, (('position_idx', 'int'), ('side', 'str'), ('symbol', 'str'), ('order_type', 'str'), ('qty', 'str'), ('price', 'str'), ('base_price', 'str'), ('stop_px', 'str'), ('time_in_force', 'str'), ('trigger_by', 'str'), ('close_on_trigger', 'bool'), ('order_link_id', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Place Conditional Order'),
+        ('private_stoporder_list', 'GET', '/futures/private/stop-order/list', True, (('symbol', 'str'), ('stop_order_status', 'str'), ('direction', 'str'), ('limit', 'int'), ('cursor', 'str')), 'Get Conditional Order'),
+        ('private_stoporder_cancel', 'POST', '/futures/private/stop-order/cancel', True, (('symbol', 'str'), ('stop_order_id', 'str'), ('order_link_id', 'str')), 'Cancel Conditional Order'),
+        ('private_stoporder_cancelall', 'POST', '/futures/private/stop-order/cancelAll', True, (('symbol', 'str'),), 'Cancel All Conditional Orders'),
+        ('private_stoporder_replace', 'POST', '/futures/private/stop-order/replace', True, (('stop_order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('p_r_qty', 'int'), ('p_r_price', 'str'), ('p_r_trigger_price', 'str'), ('take_profit', 'float'), ('stop_loss', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str')), 'Replace Conditional Order'),
+        ('private_stoporder', 'GET', '/futures/private/stop-order', True, (('symbol', 'str'), ('stop_order_id', 'str'), ('order_link_id', 'str')), 'Query Conditional Order (real-time)'),
+        ('private_position_list', 'GET', '/futures/private/position/list', True, (('symbol', 'str'),), 'My Position'),
+        ('private_position_changepositionmargin', 'POST', '/futures/private/position/change-position-margin', True, (('symbol', 'str'), ('position_idx', 'int'), ('margin', 'str')), 'Change Margin'),
+        ('private_position_tradingstop', 'POST', '/futures/private/position/trading-stop', True, (('symbol', 'str'), ('position_idx', 'int'), ('take_profit', 'float'), ('stop_loss', 'float'), ('trailing_stop', 'float'), ('tp_trigger_by', 'str'), ('sl_trigger_by', 'str'), ('new_trailing_active', 'float'), ('sl_size', 'float'), ('tp_size', 'float')), 'Set Trading-Stop'),
+        ('private_position_leverage_save', 'POST', '/futures/private/position/leverage/save', True, (('symbol', 'str'), ('buy_leverage', 'float'), ('sell_leverage', 'float')), 'Set Leverage'),
+        ('private_position_switchmode', 'POST', '/futures/private/position/switch-mode', True, (('symbol', 'str'), ('mode', 'int')), 'Position Mode Switch'),
+        ('private_tpsl_switchmode', 'POST', '/futures/private/tpsl/switch-mode', True, (('symbol', 'str'), ('tp_sl_mode', 'str')), 'Full/Partial Position SL/TP Switch'),
+        ('private_position_switchisolated', 'POST', '/futures/private/position/switch-isolated', True, (('symbol', 'str'), ('is_isolated', 'bool'), ('buy_leverage', 'float'), ('sell_leverage', 'float')), 'Cross/Isolated Margin Switch'),
+        ('private_execution_list', 'GET', '/futures/private/execution/list', True, (('order_id', 'str'), ('symbol', 'str'), ('start_time', 'int'), ('page', 'int'), ('limit', 'int'), ('order', 'str')), 'User Trade Records'),
+        ('private_trade_closedpnl_list', 'GET', '/futures/private/trade/closed-pnl/list', True, (('symbol', 'str'), ('start_time', 'int'), ('end_time', 'int'), ('exec_type', 'str'), ('page', 'int'), ('limit', 'int')), 'Closed Profit and Loss'),
+        ('private_position_risklimit', 'POST', '/futures/private/position/risk-limit', True, (('symbol', 'str'), ('risk_id', 'int'), ('position_idx', 'int')), 'Set Risk Limit'),
+        ('public_time', 'GET', '/v2/public/time', False, (), 'Server Time'),
+        ('public_announcement', 'GET', '/v2/public/announcement', False, (), 'Announcement'),
+    ),
+}
+
+# Seeded by hand, not yet regenerated from the docs: edit it directly until the next
+# util/bybit_doc_scraping.py run replaces it.
+# response fields (util/models.py): {path: ((field, type), ...)}
+RESULTS = {
+    '/v2/public/orderBook/L2': (('symbol', 'str'), ('id', 'int'), ('side', 'str'), ('price', 'float'), ('size', 'float')),
+    '/v2/public/kline/list': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/v2/public/tickers': (('symbol', 'str'), ('bid_price', 'float'), ('ask_price', 'float'), ('last_price', 'float'), ('mark_price', 'float'), ('index_price', 'float'), ('high_price_24h', 'float'), ('low_price_24h', 'float'), ('volume_24h', 'float'), ('turnover_24h', 'float'), ('open_interest', 'float'), ('funding_rate', 'float'), ('next_funding_time', 'str')),
+    '/v2/public/trading-records': (('id', 'int'), ('symbol', 'str'), ('side', 'str'), ('price', 'float'), ('qty', 'float'), ('time', 'str'), ('trade_time_ms', 'int')),
+    '/v2/public/symbols': (('name', 'str'), ('alias', 'str'), ('status', 'str'), ('base_currency', 'str'), ('quote_currency', 'str'), ('price_scale', 'int'), ('taker_fee', 'float'), ('maker_fee', 'float')),
+    '/v2/public/mark-price-kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/v2/public/index-price-kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/v2/public/premium-index-kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/v2/private/order/list': (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_type', 'str'), ('price', 'float'), ('qty', 'float'), ('time_in_force', 'str'), ('order_status', 'str'), ('leaves_qty', 'float'), ('cum_exec_qty', 'float'), ('cum_exec_value', 'float'), ('cum_exec_fee', 'float'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('created_at', 'str'), ('updated_at', 'str')),
+    '/v2/private/order': (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_type', 'str'), ('price', 'float'), ('qty', 'float'), ('time_in_force', 'str'), ('order_status', 'str'), ('leaves_qty', 'float'), ('cum_exec_qty', 'float'), ('cum_exec_value', 'float'), ('cum_exec_fee', 'float'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('created_at', 'str'), ('updated_at', 'str')),
+    '/v2/private/position/list': (('symbol', 'str'), ('side', 'str'), ('size', 'float'), ('position_value', 'float'), ('entry_price', 'float'), ('liq_price', 'float'), ('bust_price', 'float'), ('leverage', 'float'), ('position_margin', 'float'), ('unrealised_pnl', 'float'), ('realised_pnl', 'float'), ('position_idx', 'int'), ('is_isolated', 'bool')),
+    '/v2/private/execution/list': (('exec_id', 'str'), ('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_price', 'float'), ('order_qty', 'float'), ('exec_price', 'float'), ('exec_qty', 'float'), ('exec_value', 'float'), ('exec_fee', 'float'), ('fee_rate', 'float'), ('exec_type', 'str'), ('leaves_qty', 'float'), ('trade_time_ms', 'int')),
+    '/v2/private/trade/closed-pnl/list': (('order_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('qty', 'float'), ('order_price', 'float'), ('avg_entry_price', 'float'), ('avg_exit_price', 'float'), ('closed_pnl', 'float'), ('created_at', 'int')),
+    '/v2/public/funding/prev-funding-rate': (('symbol', 'str'), ('funding_rate', 'float'), ('funding_rate_timestamp', 'str')),
+    '/public/linear/kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/public/linear/recent-trading-records': (('id', 'int'), ('symbol', 'str'), ('side', 'str'), ('price', 'float'), ('qty', 'float'), ('time', 'str'), ('trade_time_ms', 'int')),
+    '/public/linear/funding/prev-funding-rate': (('symbol', 'str'), ('funding_rate', 'float'), ('funding_rate_timestamp', 'str')),
+    '/public/linear/mark-price-kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/public/linear/index-price-kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/public/linear/premium-index-kline': (('symbol', 'str'), ('interval', 'str'), ('period', 'str'), ('open_time', 'int'), ('start_at', 'int'), ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'), ('volume', 'float'), ('turnover', 'float')),
+    '/private/linear/order/list': (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_type', 'str'), ('price', 'float'), ('qty', 'float'), ('time_in_force', 'str'), ('order_status', 'str'), ('leaves_qty', 'float'), ('cum_exec_qty', 'float'), ('cum_exec_value', 'float'), ('cum_exec_fee', 'float'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('created_at', 'str'), ('updated_at', 'str')),
+    '/private/linear/order/search': (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_type', 'str'), ('price', 'float'), ('qty', 'float'), ('time_in_force', 'str'), ('order_status', 'str'), ('leaves_qty', 'float'), ('cum_exec_qty', 'float'), ('cum_exec_value', 'float'), ('cum_exec_fee', 'float'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('created_at', 'str'), ('updated_at', 'str')),
+    '/private/linear/position/list': (('symbol', 'str'), ('side', 'str'), ('size', 'float'), ('position_value', 'float'), ('entry_price', 'float'), ('liq_price', 'float'), ('bust_price', 'float'), ('leverage', 'float'), ('position_margin', 'float'), ('unrealised_pnl', 'float'), ('realised_pnl', 'float'), ('position_idx', 'int'), ('is_isolated', 'bool')),
+    '/private/linear/trade/execution/list': (('exec_id', 'str'), ('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_price', 'float'), ('order_qty', 'float'), ('exec_price', 'float'), ('exec_qty', 'float'), ('exec_value', 'float'), ('exec_fee', 'float'), ('fee_rate', 'float'), ('exec_type', 'str'), ('leaves_qty', 'float'), ('trade_time_ms', 'int')),
+    '/private/linear/trade/closed-pnl/list': (('order_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('qty', 'float'), ('order_price', 'float'), ('avg_entry_price', 'float'), ('avg_exit_price', 'float'), ('closed_pnl', 'float'), ('created_at', 'int')),
+    '/futures/private/order/list': (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_type', 'str'), ('price', 'float'), ('qty', 'float'), ('time_in_force', 'str'), ('order_status', 'str'), ('leaves_qty', 'float'), ('cum_exec_qty', 'float'), ('cum_exec_value', 'float'), ('cum_exec_fee', 'float'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('created_at', 'str'), ('updated_at', 'str')),
+    '/futures/private/order': (('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_type', 'str'), ('price', 'float'), ('qty', 'float'), ('time_in_force', 'str'), ('order_status', 'str'), ('leaves_qty', 'float'), ('cum_exec_qty', 'float'), ('cum_exec_value', 'float'), ('cum_exec_fee', 'float'), ('reduce_only', 'bool'), ('close_on_trigger', 'bool'), ('created_at', 'str'), ('updated_at', 'str')),
+    '/futures/private/position/list': (('symbol', 'str'), ('side', 'str'), ('size', 'float'), ('position_value', 'float'), ('entry_price', 'float'), ('liq_price', 'float'), ('bust_price', 'float'), ('leverage', 'float'), ('position_margin', 'float'), ('unrealised_pnl', 'float'), ('realised_pnl', 'float'), ('position_idx', 'int'), ('is_isolated', 'bool')),
+    '/futures/private/execution/list': (('exec_id', 'str'), ('order_id', 'str'), ('order_link_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('order_price', 'float'), ('order_qty', 'float'), ('exec_price', 'float'), ('exec_qty', 'float'), ('exec_value', 'float'), ('exec_fee', 'float'), ('fee_rate', 'float'), ('exec_type', 'str'), ('leaves_qty', 'float'), ('trade_time_ms', 'int')),
+    '/futures/private/trade/closed-pnl/list': (('order_id', 'str'), ('symbol', 'str'), ('side', 'str'), ('qty', 'float'), ('order_price', 'float'), ('avg_entry_price', 'float'), ('avg_exit_price', 'float'), ('closed_pnl', 'float'), ('created_at', 'int')),
+}
@@ -1,28 +1,49 @@
+import functools
+import inspect
+import keyword
+import numbers
+import time
+import types
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from .util.bulk import CANCEL, CREATE, REPLACE, BulkResult, BulkResults, _reflect, _result
+from .endpoints import ENDPOINTS
+from .util import codec
+from .util.cache import ResponseCache
+from .util.dispatch import Dispatcher
+from .util.hedge import Hedge
+from .util.metrics import RequestMetrics
+from .util.ratelimit import RateLimiter
 
 class RESTAPI:
     _MAINNET = 'https://api.bybit.com'
     _TESTNET = 'https://api-testnet.bybit.com'
 
     def __init__(self, auth, testnet):
-        self._session = requests.Session()
+        self._session = self._newsession()
         self._auth = auth
         self._url = self._MAINNET if not testnet else self._TESTNET
         self._callbacks = []
+        self.transport = None
+        self.ratelimiter = RateLimiter()
+        self.cache: ResponseCache = None
+        self.metrics: RequestMetrics = None
+        self.hedge: Hedge = None
+        self.dispatcher: Dispatcher = None
         self.inverse = Inverse(self._request)
         self.linear = Linear(self._request)
         self.futures = Futures(self._request)
 
+    def _newsession(self) -> requests.Session:
+        return requests.Session()
+
     def _prepare(self, method: str, url: str, query: dict, private: bool) -> dict:
-        for k in list(query):
-            if query[k] is None:
-                del query[k]
-        if private:
-            query = self._auth._prepare(query)
-        query_str = '&'.join(f'{k}={v}' for k, v in query.items())
+        query = {k: v for k, v in query.items() if v is not None}
         if private:
-            sign = self._auth._sign(query_str)
-            query_str += f'&{sign}'
+            query_str = self._auth._query(query)
+        else:
+            query_str = '&'.join(f'{k}={v}' for k, v in query.items())
         req_args = {'method': method, 'url': url}
         if method == 'GET':
             if len(query_str) > 0:
@@ -33,16 +54,65 @@ class RESTAPI:
         return req_args
 
     def _request(self, method: str, path: str, query: dict, private: bool) -> requests.Response:
+        if self.cache is not None and not private:
+            key = self.cache.key(method, path, query)
+            if key is not None:
+                return self.cache.fetch(key, functools.partial(self._send, method, path, query, private))
+        return self._send(method, path, query, private)
+
+    def _send(self, method: str, path: str, query: dict, private: bool) -> requests.Response:
+        t0 = time.perf_counter()
+        if self.ratelimiter is not None:
+            self.ratelimiter.acquire(method, path)
+        t1 = time.perf_counter()
         req_args = self._prepare(method, self._url + path, query, private)
-        resp = self._session.request(**req_args)
-        for cb in self._callbacks:
-            cb(resp, self._session)
+        t2 = time.perf_counter()
+        transport = self.transport if self.transport is not None else self._session
+        if self.hedge is not None and self.hedge.eligible(method, path, private):
+            resp = self.hedge.request(path, functools.partial(transport.request, **req_args))
+        else:
+            resp = transport.request(**req_args)
+        self._received(method, path, resp, self._session, (t0, t1, t2), resp.elapsed.total_seconds())
         return resp
 
+    def _received(self, method: str, path: str, resp: requests.Response, session, times: tuple, ttfb: float) -> None:
+        # shared by the sync and async pipelines once the response is in: decode, rate limit, callbacks, metrics
+        t0, t1, t2 = times
+        t3 = time.perf_counter()
+        if self.metrics is not None:
+            try:
+                codec.response_json(resp)
+            except ValueError:
+                pass
+        t4 = time.perf_counter()
+        if self.ratelimiter is not None:
+            self.ratelimiter.update(method, path, resp)
+        if self.dispatcher is not None:
+            self.dispatcher.submit(self._callbacks, resp, session)
+        else:
+            for cb in self._callbacks:
+                cb(resp, session)
+        if self.metrics is not None:
+            t5 = time.perf_counter()
+            self.metrics.record(path, resp.status_code, {
+                'queue': t1 - t0,
+                'sign': t2 - t1,
+                'wire': t3 - t2,
+                'ttfb': ttfb,
+                'decode': t4 - t3,
+                'callback': t5 - t4,
+                'total': t5 - t0,
+            })
+
     def add_callback(self, func) -> None:
         if callable(func):
             self._callbacks.append(func)
 
+    def flush(self, timeout: float=None) -> bool:
+        if self.dispatcher is not None:
+            return self.dispatcher.flush(timeout)
+        return True
+
     def initialize_request_inverse(self, symbol: str):
         return (
             self.inverse.private_order(symbol=symbol),
@@ -67,2062 +137,142 @@ class RESTAPI:
             self.inverse.private_wallet_balance(),
         )
 
-class Inverse:
-    def __init__(self, request: RESTAPI._request):
-        self._request = request
-
-    def public_orderbook_l2(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Order book
-        """
-        method = 'GET'
-        path = '/v2/public/orderBook/L2'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_kline_list(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Kline
-        """
-        method = 'GET'
-        path = '/v2/public/kline/list'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_tickers(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Latest Information for Symbol
-        """
-        method = 'GET'
-        path = '/v2/public/tickers'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_tradingrecords(
-        self,
-        symbol: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Public Trading Records
-        """
-        method = 'GET'
-        path = '/v2/public/trading-records'
-        query = {
-            'symbol': symbol,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_symbols(
-        self,
-    ) -> requests.Response:
-        """
-        Query Symbol
-        """
-        method = 'GET'
-        path = '/v2/public/symbols'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_liqrecords(
-        self,
-        symbol: str=None,
-        from_: int=None,
-        limit: int=None,
-        start_time: int=None,
-        end_time: int=None,
-    ) -> requests.Response:
-        """
-        Liquidated Orders
-        """
-        method = 'GET'
-        path = '/v2/public/liq-records'
-        query = {
-            'symbol': symbol,
-            'from': from_,
-            'limit': limit,
-            'start_time': start_time,
-            'end_time': end_time,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_markpricekline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Mark Price Kline
-        """
-        method = 'GET'
-        path = '/v2/public/mark-price-kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_indexpricekline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Index Price Kline
-        """
-        method = 'GET'
-        path = '/v2/public/index-price-kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_premiumindexkline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Premium Index Kline
-        """
-        method = 'GET'
-        path = '/v2/public/premium-index-kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_openinterest(
-        self,
-        symbol: str=None,
-        period: str=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Open Interest
-        """
-        method = 'GET'
-        path = '/v2/public/open-interest'
-        query = {
-            'symbol': symbol,
-            'period': period,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_bigdeal(
-        self,
-        symbol: str=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Latest Big Deal
-        """
-        method = 'GET'
-        path = '/v2/public/big-deal'
-        query = {
-            'symbol': symbol,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_accountratio(
-        self,
-        symbol: str=None,
-        period: str=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Long-Short Ratio
-        """
-        method = 'GET'
-        path = '/v2/public/account-ratio'
-        query = {
-            'symbol': symbol,
-            'period': period,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def private_order_create(
-        self,
-        side: str=None,
-        symbol: str=None,
-        order_type: str=None,
-        qty: int=None,
-        price: float=None,
-        time_in_force: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-        reduce_only: bool=None,
-        close_on_trigger: bool=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Place Active Order
-        """
-        method = 'POST'
-        path = '/v2/private/order/create'
-        query = {
-            'side': side,
-            'symbol': symbol,
-            'order_type': order_type,
-            'qty': qty,
-            'price': price,
-            'time_in_force': time_in_force,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-            'reduce_only': reduce_only,
-            'close_on_trigger': close_on_trigger,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_list(
-        self,
-        symbol: str=None,
-        order_status: str=None,
-        direction: str=None,
-        limit: int=None,
-        cursor: str=None,
-    ) -> requests.Response:
-        """
-        Get Active Order
-        """
-        method = 'GET'
-        path = '/v2/private/order/list'
-        query = {
-            'symbol': symbol,
-            'order_status': order_status,
-            'direction': direction,
-            'limit': limit,
-            'cursor': cursor,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_cancel(
-        self,
-        symbol: str=None,
-        order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Cancel Active Order
-        """
-        method = 'POST'
-        path = '/v2/private/order/cancel'
-        query = {
-            'symbol': symbol,
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_cancelall(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Cancel All Active Orders
-        """
-        method = 'POST'
-        path = '/v2/private/order/cancelAll'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_replace(
-        self,
-        order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        p_r_qty: str=None,
-        p_r_price: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Replace Active Order
-        """
-        method = 'POST'
-        path = '/v2/private/order/replace'
-        query = {
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'p_r_qty': p_r_qty,
-            'p_r_price': p_r_price,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order(
-        self,
-        symbol: str=None,
-        order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Query Active Order (real-time)
-        """
-        method = 'GET'
-        path = '/v2/private/order'
-        query = {
-            'symbol': symbol,
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_create(
-        self,
-        side: str=None,
-        symbol: str=None,
-        order_type: str=None,
-        qty: str=None,
-        price: str=None,
-        base_price: str=None,
-        stop_px: str=None,
-        time_in_force: str=None,
-        trigger_by: str=None,
-        close_on_trigger: bool=None,
-        order_link_id: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Place Conditional Order
-        """
-        method = 'POST'
-        path = '/v2/private/stop-order/create'
-        query = {
-            'side': side,
-            'symbol': symbol,
-            'order_type': order_type,
-            'qty': qty,
-            'price': price,
-            'base_price': base_price,
-            'stop_px': stop_px,
-            'time_in_force': time_in_force,
-            'trigger_by': trigger_by,
-            'close_on_trigger': close_on_trigger,
-            'order_link_id': order_link_id,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_list(
-        self,
-        symbol: str=None,
-        stop_order_status: str=None,
-        direction: str=None,
-        limit: int=None,
-        cursor: str=None,
-    ) -> requests.Response:
-        """
-        Get Conditional Order
-        """
-        method = 'GET'
-        path = '/v2/private/stop-order/list'
-        query = {
-            'symbol': symbol,
-            'stop_order_status': stop_order_status,
-            'direction': direction,
-            'limit': limit,
-            'cursor': cursor,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_cancel(
-        self,
-        symbol: str=None,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Cancel Conditional Order
-        """
-        method = 'POST'
-        path = '/v2/private/stop-order/cancel'
-        query = {
-            'symbol': symbol,
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_cancelall(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Cancel All Conditional Orders
-        """
-        method = 'POST'
-        path = '/v2/private/stop-order/cancelAll'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_replace(
-        self,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        p_r_qty: int=None,
-        p_r_price: str=None,
-        p_r_trigger_price: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Replace Conditional Order
-        """
-        method = 'POST'
-        path = '/v2/private/stop-order/replace'
-        query = {
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'p_r_qty': p_r_qty,
-            'p_r_price': p_r_price,
-            'p_r_trigger_price': p_r_trigger_price,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder(
-        self,
-        symbol: str=None,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Query Conditional Order (real-time)
-        """
-        method = 'GET'
-        path = '/v2/private/stop-order'
-        query = {
-            'symbol': symbol,
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_list(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        My Position
-        """
-        method = 'GET'
-        path = '/v2/private/position/list'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_changepositionmargin(
-        self,
-        symbol: str=None,
-        margin: str=None,
-    ) -> requests.Response:
-        """
-        Change Margin
-        """
-        method = 'POST'
-        path = '/v2/private/position/change-position-margin'
-        query = {
-            'symbol': symbol,
-            'margin': margin,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_tradingstop(
-        self,
-        symbol: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        trailing_stop: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-        new_trailing_active: float=None,
-        sl_size: float=None,
-        tp_size: float=None,
-    ) -> requests.Response:
-        """
-        Set Trading-Stop
-        """
-        method = 'POST'
-        path = '/v2/private/position/trading-stop'
-        query = {
-            'symbol': symbol,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'trailing_stop': trailing_stop,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-            'new_trailing_active': new_trailing_active,
-            'sl_size': sl_size,
-            'tp_size': tp_size,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_leverage_save(
-        self,
-        symbol: str=None,
-        leverage: float=None,
-    ) -> requests.Response:
-        """
-        Set Leverage
-        """
-        method = 'POST'
-        path = '/v2/private/position/leverage/save'
-        query = {
-            'symbol': symbol,
-            'leverage': leverage,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_execution_list(
-        self,
-        order_id: str=None,
-        symbol: str=None,
-        start_time: int=None,
-        page: int=None,
-        limit: int=None,
-        order: str=None,
-    ) -> requests.Response:
-        """
-        User Trade Records
-        """
-        method = 'GET'
-        path = '/v2/private/execution/list'
-        query = {
-            'order_id': order_id,
-            'symbol': symbol,
-            'start_time': start_time,
-            'page': page,
-            'limit': limit,
-            'order': order,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_trade_closedpnl_list(
-        self,
-        symbol: str=None,
-        start_time: int=None,
-        end_time: int=None,
-        exec_type: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Closed Profit and Loss
-        """
-        method = 'GET'
-        path = '/v2/private/trade/closed-pnl/list'
-        query = {
-            'symbol': symbol,
-            'start_time': start_time,
-            'end_time': end_time,
-            'exec_type': exec_type,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_tpsl_switchmode(
-        self,
-        symbol: str=None,
-        tp_sl_mode: str=None,
-    ) -> requests.Response:
-        """
-        Full/Partial Position SL/TP Switch
-        """
-        method = 'POST'
-        path = '/v2/private/tpsl/switch-mode'
-        query = {
-            'symbol': symbol,
-            'tp_sl_mode': tp_sl_mode,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_switchisolated(
-        self,
-        symbol: str=None,
-        is_isolated: bool=None,
-        buy_leverage: float=None,
-        sell_leverage: float=None,
-    ) -> requests.Response:
-        """
-        Cross/Isolated Margin Switch
-        """
-        method = 'POST'
-        path = '/v2/private/position/switch-isolated'
-        query = {
-            'symbol': symbol,
-            'is_isolated': is_isolated,
-            'buy_leverage': buy_leverage,
-            'sell_leverage': sell_leverage,
-        }
-        return self._request(method, path, query, private=True)
-
-    def public_risklimit_list(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Get Risk Limit
-        """
-        method = 'GET'
-        path = '/v2/public/risk-limit/list'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=False)
-
-    def private_position_risklimit(
-        self,
-        symbol: str=None,
-        risk_id: int=None,
-    ) -> requests.Response:
-        """
-        Set Risk Limit
-        """
-        method = 'POST'
-        path = '/v2/private/position/risk-limit'
-        query = {
-            'symbol': symbol,
-            'risk_id': risk_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def public_funding_prevfundingrate(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Get the Last Funding Rate
-        """
-        method = 'GET'
-        path = '/v2/public/funding/prev-funding-rate'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=False)
-
-    def private_funding_prevfunding(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        My Last Funding Fee
-        """
-        method = 'GET'
-        path = '/v2/private/funding/prev-funding'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_funding_predictedfunding(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Predicted Funding Rate and My Funding Fee
-        """
-        method = 'GET'
-        path = '/v2/private/funding/predicted-funding'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_account_apikey(
-        self,
-    ) -> requests.Response:
-        """
-        API Key Info
-        """
-        method = 'GET'
-        path = '/v2/private/account/api-key'
-        query = {
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_account_lcp(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        LCP Info
-        """
-        method = 'GET'
-        path = '/v2/private/account/lcp'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_wallet_balance(
-        self,
-        coin: str=None,
-    ) -> requests.Response:
-        """
-        Get Wallet Balance
-        """
-        method = 'GET'
-        path = '/v2/private/wallet/balance'
-        query = {
-            'coin': coin,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_wallet_fund_records(
-        self,
-        start_date: str=None,
-        end_date: str=None,
-        currency: str=None,
-        coin: str=None,
-        wallet_fund_type: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Wallet Fund Records
-        """
-        method = 'GET'
-        path = '/v2/private/wallet/fund/records'
-        query = {
-            'start_date': start_date,
-            'end_date': end_date,
-            'currency': currency,
-            'coin': coin,
-            'wallet_fund_type': wallet_fund_type,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_wallet_withdraw_list(
-        self,
-        start_date: str=None,
-        end_date: str=None,
-        coin: str=None,
-        status: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Withdraw Records
-        """
-        method = 'GET'
-        path = '/v2/private/wallet/withdraw/list'
-        query = {
-            'start_date': start_date,
-            'end_date': end_date,
-            'coin': coin,
-            'status': status,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_exchangeorder_list(
-        self,
-        limit: int=None,
-        from_: int=None,
-        direction: str=None,
-    ) -> requests.Response:
-        """
-        Asset Exchange Records
-        """
-        method = 'GET'
-        path = '/v2/private/exchange-order/list'
-        query = {
-            'limit': limit,
-            'from': from_,
-            'direction': direction,
-        }
-        return self._request(method, path, query, private=True)
-
-    def public_time(
-        self,
-    ) -> requests.Response:
-        """
-        Server Time
-        """
-        method = 'GET'
-        path = '/v2/public/time'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_announcement(
-        self,
-    ) -> requests.Response:
-        """
-        Announcement
-        """
-        method = 'GET'
-        path = '/v2/public/announcement'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
-
-class Linear:
-    def __init__(self, request: RESTAPI._request):
-        self._request = request
-
-    def public_kline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Kline
-        """
-        method = 'GET'
-        path = '/public/linear/kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_recenttradingrecords(
-        self,
-        symbol: str=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Public Trading Records
-        """
-        method = 'GET'
-        path = '/public/linear/recent-trading-records'
-        query = {
-            'symbol': symbol,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_funding_prevfundingrate(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Get the Last Funding Rate
-        """
-        method = 'GET'
-        path = '/public/linear/funding/prev-funding-rate'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_markpricekline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Mark Price Kline
-        """
-        method = 'GET'
-        path = '/public/linear/mark-price-kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_indexpricekline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Index Price Kline
-        """
-        method = 'GET'
-        path = '/public/linear/index-price-kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_premiumindexkline(
-        self,
-        symbol: str=None,
-        interval: str=None,
-        from_: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Query Premium Index Kline
-        """
-        method = 'GET'
-        path = '/public/linear/premium-index-kline'
-        query = {
-            'symbol': symbol,
-            'interval': interval,
-            'from': from_,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=False)
-
-    def private_order_create(
-        self,
-        side: str=None,
-        symbol: str=None,
-        order_type: str=None,
-        qty: float=None,
-        price: float=None,
-        time_in_force: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-        reduce_only: bool=None,
-        close_on_trigger: bool=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Place Active Order
-        """
-        method = 'POST'
-        path = '/private/linear/order/create'
-        query = {
-            'side': side,
-            'symbol': symbol,
-            'order_type': order_type,
-            'qty': qty,
-            'price': price,
-            'time_in_force': time_in_force,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-            'reduce_only': reduce_only,
-            'close_on_trigger': close_on_trigger,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_list(
-        self,
-        order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        order: str=None,
-        page: int=None,
-        limit: int=None,
-        order_status: str=None,
-    ) -> requests.Response:
-        """
-        Get Active Order
-        """
-        method = 'GET'
-        path = '/private/linear/order/list'
-        query = {
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'order': order,
-            'page': page,
-            'limit': limit,
-            'order_status': order_status,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_cancel(
-        self,
-        symbol: str=None,
-        order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Cancel Active Order
-        """
-        method = 'POST'
-        path = '/private/linear/order/cancel'
-        query = {
-            'symbol': symbol,
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_cancelall(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Cancel All Active Orders
-        """
-        method = 'POST'
-        path = '/private/linear/order/cancel-all'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_replace(
-        self,
-        order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        p_r_qty: str=None,
-        p_r_price: float=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Replace Active Order
-        """
-        method = 'POST'
-        path = '/private/linear/order/replace'
-        query = {
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'p_r_qty': p_r_qty,
-            'p_r_price': p_r_price,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_search(
-        self,
-        order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Query Active Order (real-time)
-        """
-        method = 'GET'
-        path = '/private/linear/order/search'
-        query = {
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_create(
-        self,
-        side: str=None,
-        symbol: str=None,
-        order_type: str=None,
-        qty: float=None,
-        price: float=None,
-        base_price: float=None,
-        stop_px: float=None,
-        time_in_force: str=None,
-        trigger_by: str=None,
-        close_on_trigger: bool=None,
-        order_link_id: str=None,
-        reduce_only: bool=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Place Conditional Order
-        """
-        method = 'POST'
-        path = '/private/linear/stop-order/create'
-        query = {
-            'side': side,
-            'symbol': symbol,
-            'order_type': order_type,
-            'qty': qty,
-            'price': price,
-            'base_price': base_price,
-            'stop_px': stop_px,
-            'time_in_force': time_in_force,
-            'trigger_by': trigger_by,
-            'close_on_trigger': close_on_trigger,
-            'order_link_id': order_link_id,
-            'reduce_only': reduce_only,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_list(
-        self,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        stop_order_status: str=None,
-        order: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Get Conditional Order
-        """
-        method = 'GET'
-        path = '/private/linear/stop-order/list'
-        query = {
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'stop_order_status': stop_order_status,
-            'order': order,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_cancel(
-        self,
-        symbol: str=None,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Cancel Conditional Order
-        """
-        method = 'POST'
-        path = '/private/linear/stop-order/cancel'
-        query = {
-            'symbol': symbol,
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_cancelall(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Cancel All Conditional Orders
-        """
-        method = 'POST'
-        path = '/private/linear/stop-order/cancel-all'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_replace(
-        self,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        p_r_qty: str=None,
-        p_r_price: float=None,
-        p_r_trigger_price: float=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Replace Conditional Order
-        """
-        method = 'POST'
-        path = '/private/linear/stop-order/replace'
-        query = {
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'p_r_qty': p_r_qty,
-            'p_r_price': p_r_price,
-            'p_r_trigger_price': p_r_trigger_price,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_search(
-        self,
-        symbol: str=None,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Query Conditional Order (real-time)
-        """
-        method = 'GET'
-        path = '/private/linear/stop-order/search'
-        query = {
-            'symbol': symbol,
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_list(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        My Position
-        """
-        method = 'GET'
-        path = '/private/linear/position/list'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_setautoaddmargin(
-        self,
-        symbol: str=None,
-        side: str=None,
-        auto_add_margin: bool=None,
-    ) -> requests.Response:
-        """
-        Set Auto Add Margin
-        """
-        method = 'POST'
-        path = '/private/linear/position/set-auto-add-margin'
-        query = {
-            'symbol': symbol,
-            'side': side,
-            'auto_add_margin': auto_add_margin,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_switchisolated(
-        self,
-        symbol: str=None,
-        is_isolated: bool=None,
-        buy_leverage: float=None,
-        sell_leverage: float=None,
-    ) -> requests.Response:
-        """
-        Cross/Isolated Margin Switch
-        """
-        method = 'POST'
-        path = '/private/linear/position/switch-isolated'
-        query = {
-            'symbol': symbol,
-            'is_isolated': is_isolated,
-            'buy_leverage': buy_leverage,
-            'sell_leverage': sell_leverage,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_tpsl_switchmode(
-        self,
-        symbol: str=None,
-        tp_sl_mode: str=None,
-    ) -> requests.Response:
-        """
-        Full/Partial Position SL/TP Switch
-        """
-        method = 'POST'
-        path = '/private/linear/tpsl/switch-mode'
-        query = {
-            'symbol': symbol,
-            'tp_sl_mode': tp_sl_mode,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_addmargin(
-        self,
-        symbol: str=None,
-        side: str=None,
-        margin: float=None,
-    ) -> requests.Response:
-        """
-        Add/Reduce Margin
-        """
-        method = 'POST'
-        path = '/private/linear/position/add-margin'
-        query = {
-            'symbol': symbol,
-            'side': side,
-            'margin': margin,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_setleverage(
-        self,
-        symbol: str=None,
-        buy_leverage: float=None,
-        sell_leverage: float=None,
-    ) -> requests.Response:
-        """
-        Set Leverage
-        """
-        method = 'POST'
-        path = '/private/linear/position/set-leverage'
-        query = {
-            'symbol': symbol,
-            'buy_leverage': buy_leverage,
-            'sell_leverage': sell_leverage,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_tradingstop(
-        self,
-        symbol: str=None,
-        side: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        trailing_stop: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-        sl_size: float=None,
-        tp_size: float=None,
-    ) -> requests.Response:
-        """
-        Set Trading-Stop
-        """
-        method = 'POST'
-        path = '/private/linear/position/trading-stop'
-        query = {
-            'symbol': symbol,
-            'side': side,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'trailing_stop': trailing_stop,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-            'sl_size': sl_size,
-            'tp_size': tp_size,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_trade_execution_list(
-        self,
-        symbol: str=None,
-        start_time: int=None,
-        end_time: int=None,
-        exec_type: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        User Trade Records
-        """
-        method = 'GET'
-        path = '/private/linear/trade/execution/list'
-        query = {
-            'symbol': symbol,
-            'start_time': start_time,
-            'end_time': end_time,
-            'exec_type': exec_type,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_trade_closedpnl_list(
-        self,
-        symbol: str=None,
-        start_time: int=None,
-        end_time: int=None,
-        exec_type: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Closed Profit and Loss
-        """
-        method = 'GET'
-        path = '/private/linear/trade/closed-pnl/list'
-        query = {
-            'symbol': symbol,
-            'start_time': start_time,
-            'end_time': end_time,
-            'exec_type': exec_type,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def public_risklimit(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Get Risk Limit
-        """
-        method = 'GET'
-        path = '/public/linear/risk-limit'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=False)
-
-    def private_position_setrisk(
-        self,
-        symbol: str=None,
-        side: str=None,
-        risk_id: int=None,
-    ) -> requests.Response:
-        """
-        Set Risk Limit
-        """
-        method = 'POST'
-        path = '/private/linear/position/set-risk'
-        query = {
-            'symbol': symbol,
-            'side': side,
-            'risk_id': risk_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_funding_predictedfunding(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Predicted Funding Rate and My Funding Fee
-        """
-        method = 'GET'
-        path = '/private/linear/funding/predicted-funding'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_funding_prevfunding(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        My Last Funding Fee
-        """
-        method = 'GET'
-        path = '/private/linear/funding/prev-funding'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def public_time(
-        self,
-    ) -> requests.Response:
-        """
-        Server Time
-        """
-        method = 'GET'
-        path = '/v2/public/time'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
+    def _initialize_calls(self, inverse: list, linear: list, futures: list) -> list:
+        calls = {}
+        for contract, symbols, names in (
+            (self.inverse, inverse, ('private_order', 'private_stoporder', 'private_position_list', )),
+            (self.linear, linear, ('private_order_search', 'private_stoporder_search', 'private_position_list', )),
+            (self.futures, futures, ('private_order', 'private_stoporder', 'private_position_list', )),
+        ):
+            for symbol in symbols:
+                for name in names:
+                    calls[(type(contract).__name__, name, symbol)] = (getattr(contract, name), {'symbol': symbol})
+        if calls:
+            calls[('Inverse', 'private_wallet_balance', None)] = (self.inverse.private_wallet_balance, {})
+        return list(calls.values())
+
+    def initialize_request(self, inverse: list=(), linear: list=(), futures: list=(), max_workers: int=8) -> list:
+        calls = self._initialize_calls(inverse, linear, futures)
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fs = [executor.submit(func, **kwargs) for func, kwargs in calls]
+            return [f.result() for f in fs]
+
+    def _bulk_call(self, func, spec: dict, action: str, store) -> BulkResult:
+        try:
+            result = _result(spec, func(**spec))
+        except Exception as e:
+            return BulkResult(spec, None, None, e)
+        _reflect(store, result, action)
+        return result
+
+    def bulk_order(self, calls: list, store=None, max_workers: int=10) -> BulkResults:
+        """
+        calls: [(endpoint method, kwargs, 'create' | 'cancel' | 'replace'), ...]
+        """
+        if not calls:
+            return BulkResults()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fs = [executor.submit(self._bulk_call, func, spec, action, store) for func, spec, action in calls]
+            return BulkResults(f.result() for f in fs)
+
+    def bulk_order_create(self, func, orders: list, store=None, max_workers: int=10) -> BulkResults:
+        return self.bulk_order([(func, spec, CREATE) for spec in orders], store, max_workers)
+
+    def bulk_order_cancel(self, func, orders: list, store=None, max_workers: int=10) -> BulkResults:
+        return self.bulk_order([(func, spec, CANCEL) for spec in orders], store, max_workers)
+
+    def bulk_order_replace(self, func, orders: list, store=None, max_workers: int=10) -> BulkResults:
+        return self.bulk_order([(func, spec, REPLACE) for spec in orders], store, max_workers)
+
+def _number(v) -> Optional[float]:
+    # int, float, Decimal, numpy scalars, numeric strings: anything whose str() is a number
+    if isinstance(v, bool):
+        return None
+    try:
+        return float(str(v))
+    except ValueError:
+        return None
+
+def _is_str(v) -> bool:
+    return isinstance(v, (str, numbers.Number, ))
+
+def _is_int(v) -> bool:
+    n = _number(v)
+    return n is not None and n.is_integer()
+
+def _is_float(v) -> bool:
+    n = _number(v)
+    return n is not None and n == n
+
+def _is_bool(v) -> bool:
+    return isinstance(v, bool) or v in ('true', 'false', 'True', 'False', )
+
+# spec param type -> accepted values (numbers in any numeric type or as strings)
+_VALIDATORS = {'str': _is_str, 'int': _is_int, 'float': _is_float, 'bool': _is_bool}
+
+class _Endpoint:
+    __slots__ = ('__name__', '__doc__', 'method', 'path', 'private', 'params', '_types', '_names', )
+
+    def __init__(self, name: str, method: str, path: str, private: bool, params: tuple, desc: str) -> None:
+        self.__name__ = name
+        self.__doc__ = desc
+        self.method = method
+        self.path = path
+        self.private = private
+        self.params = tuple(k for k, t in params)
+        self._types = tuple(t for k, t in params)
+        # python keyword argument name -> query parameter name (ex: from_ -> from)
+        self._names = {k if not keyword.iskeyword(k) else f'{k}_': k for k in self.params}
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+        names = list(self._names)
+        return inspect.Signature(
+            [inspect.Parameter('self', kind)]
+            + [inspect.Parameter(k, kind, default=None, annotation=t) for k, t in zip(names, self._types)],
+            return_annotation='requests.Response',
+        )
 
-    def public_announcement(
-        self,
-    ) -> requests.Response:
-        """
-        Announcement
-        """
-        method = 'GET'
-        path = '/v2/public/announcement'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def __call__(self, contract: '_Contract', *args, **kwargs) -> requests.Response:
+        if len(args) > len(self.params):
+            raise TypeError(f'{self.__name__}() takes {len(self.params)} positional arguments but {len(args)} were given')
+        query = dict.fromkeys(self.params)
+        query.update(zip(self.params, args))
+        for k, v in kwargs.items():
+            if k not in self._names:
+                raise TypeError(f"{self.__name__}() got an unexpected keyword argument '{k}'")
+            query[self._names[k]] = v
+        for (k, v), t in zip(query.items(), self._types):
+            if v is not None and not _VALIDATORS[t](v):
+                raise TypeError(f"{self.__name__}() argument '{k}' must be {t}, not {v!r}")
+        return contract._request(self.method, self.path, query, private=self.private)
+
+    def __repr__(self) -> str:
+        return f'<endpoint {self.__name__} {self.method} {self.path}>'
+
+class _Contract:
+    _ENDPOINTS: tuple = ()
+
+    def __init_subclass__(cls) -> None:
+        for spec in cls._ENDPOINTS:
+            setattr(cls, spec[0], _Endpoint(*spec))
 
-class Futures:
     def __init__(self, request: RESTAPI._request):
         self._request = request
 
-    def private_order_create(
-        self,
-        position_idx: int=None,
-        side: str=None,
-        symbol: str=None,
-        order_type: str=None,
-        qty: int=None,
-        price: float=None,
-        time_in_force: str=None,
-        reduce_only: bool=None,
-        close_on_trigger: bool=None,
-        order_link_id: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Place Active Order
-        """
-        method = 'POST'
-        path = '/futures/private/order/create'
-        query = {
-            'position_idx': position_idx,
-            'side': side,
-            'symbol': symbol,
-            'order_type': order_type,
-            'qty': qty,
-            'price': price,
-            'time_in_force': time_in_force,
-            'reduce_only': reduce_only,
-            'close_on_trigger': close_on_trigger,
-            'order_link_id': order_link_id,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_list(
-        self,
-        symbol: str=None,
-        order_status: str=None,
-        direction: str=None,
-        limit: int=None,
-        cursor: str=None,
-    ) -> requests.Response:
-        """
-        Get Active Order
-        """
-        method = 'GET'
-        path = '/futures/private/order/list'
-        query = {
-            'symbol': symbol,
-            'order_status': order_status,
-            'direction': direction,
-            'limit': limit,
-            'cursor': cursor,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_cancel(
-        self,
-        symbol: str=None,
-        order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Cancel Active Order
-        """
-        method = 'POST'
-        path = '/futures/private/order/cancel'
-        query = {
-            'symbol': symbol,
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_cancelall(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Cancel All Active Orders
-        """
-        method = 'POST'
-        path = '/futures/private/order/cancelAll'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order_replace(
-        self,
-        order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        p_r_qty: str=None,
-        p_r_price: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Replace Active Order
-        """
-        method = 'POST'
-        path = '/futures/private/order/replace'
-        query = {
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'p_r_qty': p_r_qty,
-            'p_r_price': p_r_price,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_order(
-        self,
-        symbol: str=None,
-        order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Query Active Order (real-time)
-        """
-        method = 'GET'
-        path = '/futures/private/order'
-        query = {
-            'symbol': symbol,
-            'order_id': order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_create(
-        self,
-        position_idx: int=None,
-        side: str=None,
-        symbol: str=None,
-        order_type: str=None,
-        qty: str=None,
-        price: str=None,
-        base_price: str=None,
-        stop_px: str=None,
-        time_in_force: str=None,
-        trigger_by: str=None,
-        close_on_trigger: bool=None,
-        order_link_id: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Place Conditional Order
-        """
-        method = 'POST'
-        path = '/futures/private/stop-order/create'
-        query = {
-            'position_idx': position_idx,
-            'side': side,
-            'symbol': symbol,
-            'order_type': order_type,
-            'qty': qty,
-            'price': price,
-            'base_price': base_price,
-            'stop_px': stop_px,
-            'time_in_force': time_in_force,
-            'trigger_by': trigger_by,
-            'close_on_trigger': close_on_trigger,
-            'order_link_id': order_link_id,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_list(
-        self,
-        symbol: str=None,
-        stop_order_status: str=None,
-        direction: str=None,
-        limit: int=None,
-        cursor: str=None,
-    ) -> requests.Response:
-        """
-        Get Conditional Order
-        """
-        method = 'GET'
-        path = '/futures/private/stop-order/list'
-        query = {
-            'symbol': symbol,
-            'stop_order_status': stop_order_status,
-            'direction': direction,
-            'limit': limit,
-            'cursor': cursor,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_cancel(
-        self,
-        symbol: str=None,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Cancel Conditional Order
-        """
-        method = 'POST'
-        path = '/futures/private/stop-order/cancel'
-        query = {
-            'symbol': symbol,
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_cancelall(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        Cancel All Conditional Orders
-        """
-        method = 'POST'
-        path = '/futures/private/stop-order/cancelAll'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder_replace(
-        self,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-        symbol: str=None,
-        p_r_qty: int=None,
-        p_r_price: str=None,
-        p_r_trigger_price: str=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-    ) -> requests.Response:
-        """
-        Replace Conditional Order
-        """
-        method = 'POST'
-        path = '/futures/private/stop-order/replace'
-        query = {
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-            'symbol': symbol,
-            'p_r_qty': p_r_qty,
-            'p_r_price': p_r_price,
-            'p_r_trigger_price': p_r_trigger_price,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_stoporder(
-        self,
-        symbol: str=None,
-        stop_order_id: str=None,
-        order_link_id: str=None,
-    ) -> requests.Response:
-        """
-        Query Conditional Order (real-time)
-        """
-        method = 'GET'
-        path = '/futures/private/stop-order'
-        query = {
-            'symbol': symbol,
-            'stop_order_id': stop_order_id,
-            'order_link_id': order_link_id,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_list(
-        self,
-        symbol: str=None,
-    ) -> requests.Response:
-        """
-        My Position
-        """
-        method = 'GET'
-        path = '/futures/private/position/list'
-        query = {
-            'symbol': symbol,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_changepositionmargin(
-        self,
-        symbol: str=None,
-        position_idx: int=None,
-        margin: str=None,
-    ) -> requests.Response:
-        """
-        Change Margin
-        """
-        method = 'POST'
-        path = '/futures/private/position/change-position-margin'
-        query = {
-            'symbol': symbol,
-            'position_idx': position_idx,
-            'margin': margin,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_tradingstop(
-        self,
-        symbol: str=None,
-        position_idx: int=None,
-        take_profit: float=None,
-        stop_loss: float=None,
-        trailing_stop: float=None,
-        tp_trigger_by: str=None,
-        sl_trigger_by: str=None,
-        new_trailing_active: float=None,
-        sl_size: float=None,
-        tp_size: float=None,
-    ) -> requests.Response:
-        """
-        Set Trading-Stop
-        """
-        method = 'POST'
-        path = '/futures/private/position/trading-stop'
-        query = {
-            'symbol': symbol,
-            'position_idx': position_idx,
-            'take_profit': take_profit,
-            'stop_loss': stop_loss,
-            'trailing_stop': trailing_stop,
-            'tp_trigger_by': tp_trigger_by,
-            'sl_trigger_by': sl_trigger_by,
-            'new_trailing_active': new_trailing_active,
-            'sl_size': sl_size,
-            'tp_size': tp_size,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_leverage_save(
-        self,
-        symbol: str=None,
-        buy_leverage: float=None,
-        sell_leverage: float=None,
-    ) -> requests.Response:
-        """
-        Set Leverage
-        """
-        method = 'POST'
-        path = '/futures/private/position/leverage/save'
-        query = {
-            'symbol': symbol,
-            'buy_leverage': buy_leverage,
-            'sell_leverage': sell_leverage,
-        }
-        return self._request(method, path, query, private=True)
+class Inverse(_Contract):
+    _ENDPOINTS = ENDPOINTS['Inverse']
 
-    def private_position_switchmode(
-        self,
-        symbol: str=None,
-        mode: int=None,
-    ) -> requests.Response:
-        """
-        Position Mode Switch
-        """
-        method = 'POST'
-        path = '/futures/private/position/switch-mode'
-        query = {
-            'symbol': symbol,
-            'mode': mode,
-        }
-        return self._request(method, path, query, private=True)
+class Linear(_Contract):
+    _ENDPOINTS = ENDPOINTS['Linear']
 
-    def private_tpsl_switchmode(
-        self,
-        symbol: str=None,
-        tp_sl_mode: str=None,
-    ) -> requests.Response:
-        """
-        Full/Partial Position SL/TP Switch
-        """
-        method = 'POST'
-        path = '/futures/private/tpsl/switch-mode'
-        query = {
-            'symbol': symbol,
-            'tp_sl_mode': tp_sl_mode,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_switchisolated(
-        self,
-        symbol: str=None,
-        is_isolated: bool=None,
-        buy_leverage: float=None,
-        sell_leverage: float=None,
-    ) -> requests.Response:
-        """
-        Cross/Isolated Margin Switch
-        """
-        method = 'POST'
-        path = '/futures/private/position/switch-isolated'
-        query = {
-            'symbol': symbol,
-            'is_isolated': is_isolated,
-            'buy_leverage': buy_leverage,
-            'sell_leverage': sell_leverage,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_execution_list(
-        self,
-        order_id: str=None,
-        symbol: str=None,
-        start_time: int=None,
-        page: int=None,
-        limit: int=None,
-        order: str=None,
-    ) -> requests.Response:
-        """
-        User Trade Records
-        """
-        method = 'GET'
-        path = '/futures/private/execution/list'
-        query = {
-            'order_id': order_id,
-            'symbol': symbol,
-            'start_time': start_time,
-            'page': page,
-            'limit': limit,
-            'order': order,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_trade_closedpnl_list(
-        self,
-        symbol: str=None,
-        start_time: int=None,
-        end_time: int=None,
-        exec_type: str=None,
-        page: int=None,
-        limit: int=None,
-    ) -> requests.Response:
-        """
-        Closed Profit and Loss
-        """
-        method = 'GET'
-        path = '/futures/private/trade/closed-pnl/list'
-        query = {
-            'symbol': symbol,
-            'start_time': start_time,
-            'end_time': end_time,
-            'exec_type': exec_type,
-            'page': page,
-            'limit': limit,
-        }
-        return self._request(method, path, query, private=True)
-
-    def private_position_risklimit(
-        self,
-        symbol: str=None,
-        risk_id: int=None,
-        position_idx: int=None,
-    ) -> requests.Response:
-        """
-        Set Risk Limit
-        """
-        method = 'POST'
-        path = '/futures/private/position/risk-limit'
-        query = {
-            'symbol': symbol,
-            'risk_id': risk_id,
-            'position_idx': position_idx,
-        }
-        return self._request(method, path, query, private=True)
-
-    def public_time(
-        self,
-    ) -> requests.Response:
-        """
-        Server Time
-        """
-        method = 'GET'
-        path = '/v2/public/time'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
-
-    def public_announcement(
-        self,
-    ) -> requests.Response:
-        """
-        Announcement
-        """
-        method = 'GET'
-        path = '/v2/public/announcement'
-        query = {
-        }
-        return self._request(method, path, query, private=False)
+class Futures(_Contract):
+    _ENDPOINTS = ENDPOINTS['Futures']
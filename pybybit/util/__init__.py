@@ -0,0 +1,10 @@
+import importlib
+
+def __getattr__(name: str):
+    # pybybit.util.store etc. resolve without an explicit import of the submodule
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,21 +1,57 @@
 import hmac
 import hashlib
-import time
+from operator import itemgetter
+from typing import Callable, Dict, Tuple
+from .clock import Clock
 
 class Authentication:
+    _AUTH_KEYS = ('api_key', 'timestamp', )
+
     def __init__(self, key: str='', secret: str='') -> None:
         self._key = key
         self._secret = secret.encode()
+        self._clock = Clock()
+        self._hmac = hmac.new(self._secret, digestmod=hashlib.sha256)
+        self._templates: Dict[Tuple[str, ...], Tuple[str, Callable]] = {}
 
     def _prepare(self, req_args: dict) -> dict:
-        auth_args = {'api_key': self._key, 'timestamp': int(time.time() * 1000)}
+        auth_args = {'api_key': self._key, 'timestamp': self._clock.timestamp()}
         return dict(sorted({**req_args, **auth_args}.items()))
 
     def _sign(self, query_str: str) -> str:
-        hexdigest = hmac.new(self._secret, query_str.encode(), hashlib.sha256).hexdigest()
-        return f'sign={hexdigest}'
+        h = self._hmac.copy()
+        h.update(query_str.encode())
+        return f'sign={h.hexdigest()}'
+
+    @staticmethod
+    def _escape(s: str) -> str:
+        return s.replace('{', '{{').replace('}', '}}')
+
+    def _template(self, keys: Tuple[str, ...]) -> Tuple[str, Callable]:
+        params = sorted(k for k in keys if k not in self._AUTH_KEYS)
+        fields = {'api_key': self._escape(f'api_key={self._key}'), 'timestamp': 'timestamp={timestamp}'}
+        for i, k in enumerate(params):
+            fields[k] = f'{self._escape(k)}={{{i}}}'
+        template = '&'.join(fields[k] for k in sorted(fields))
+        if len(params) > 1:
+            getter = itemgetter(*params)
+        elif len(params) == 1:
+            getter = lambda query, key=params[0]: (query[key], )
+        else:
+            getter = lambda query: ()
+        return template, getter
+
+    def _query(self, query: dict) -> str:
+        keys = tuple(query)
+        try:
+            template, getter = self._templates[keys]
+        except KeyError:
+            template, getter = self._templates[keys] = self._template(keys)
+        query_str = template.format(*getter(query), timestamp=self._clock.timestamp())
+        return f'{query_str}&{self._sign(query_str)}'
 
     def _wssign(self) -> str:
-        expires = int((time.time() + 5.0) * 1000)
-        signature = hmac.new(self._secret, f'GET/realtime{expires}'.encode(), hashlib.sha256).hexdigest()
-        return f'api_key={self._key}&expires={expires}&signature={signature}'
+        expires = int((self._clock.time() + 5.0) * 1000)
+        h = self._hmac.copy()
+        h.update(f'GET/realtime{expires}'.encode())
+        return f'api_key={self._key}&expires={expires}&signature={h.hexdigest()}'
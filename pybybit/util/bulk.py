@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+from requests import Response
+from . import codec
+
+class BulkResult(NamedTuple):
+    spec: Dict[str, Any]
+    response: Optional[Response]
+    content: Optional[Dict[str, Any]]
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and isinstance(self.content, dict) and self.content.get('ret_code') == 0
+
+class BulkResults(List[BulkResult]):
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self)
+
+    @property
+    def failures(self) -> List[BulkResult]:
+        return [r for r in self if not r.ok]
+
+def _result(spec: Dict[str, Any], resp: Response) -> BulkResult:
+    try:
+        content = codec.response_json(resp)
+    except ValueError as e:
+        return BulkResult(spec, resp, None, e)
+    return BulkResult(spec, resp, content, None)
+
+CREATE = 'create'
+CANCEL = 'cancel'
+REPLACE = 'replace'
+
+# order not exists / already filled or cancelled
+_GONE = (20001, 30032, 30034, 30037, 130010, )
+
+def _reflect(store, result: BulkResult, action: str) -> None:
+    if store is None:
+        return
+    if action in (CANCEL, REPLACE, ) and isinstance(result.content, dict) and result.content.get('ret_code') in _GONE:
+        if result.spec.get('order_id') is not None:
+            store._pop([{'order_id': result.spec['order_id']}])
+        return
+    if not result.ok or not isinstance(result.content.get('result'), dict):
+        return
+    if action == CANCEL:
+        store._pop([result.content['result']])
+    elif action == REPLACE:
+        # the replace response only echoes the order id: apply the new price/qty to the stored order
+        item = {'order_id': result.content['result'].get('order_id', result.spec.get('order_id'))}
+        if store.get(**item) is not None:
+            if result.spec.get('p_r_price') is not None:
+                item['price'] = result.spec['p_r_price']
+            if result.spec.get('p_r_qty') is not None:
+                item['qty'] = result.spec['p_r_qty']
+            store._update([item])
+    else:
+        store._onresponse([result.content['result']])
@@ -1,11 +1,9 @@
-import keyword
-
 import bs4
 import requests
 
 # pip isntall requests bs4
 
-# Running the script will create a bybit_doc_scraping.txt and md file in the current directory.
+# Running the script will create an endpoints.py (copy to pybybit/endpoints.py) and bybit_doc_scraping.md file in the current directory.
 
 urls = {
     'Inverse': 'https://bybit-exchange.github.io/docs/inverse',
@@ -18,33 +16,38 @@ rm_pathname = ['v2', 'linear', 'futures']
 repl_pathname = {'open-api': 'private'}
 
 type_mapping = {
-    'string': str,
-    'integer': int,
-    'int': int,
-    'number': float,
-    'bool': bool,
+    'string': 'str',
+    'integer': 'int',
+    'int': 'int',
+    'number': 'float',
+    'bool': 'bool',
 }
 
 table = {}
-with open('bybit_doc_scraping.txt', 'w') as f:
+results = {}
+with open('endpoints.py', 'w') as f:
+    text = ''
+    text += '# Generated by util/bybit_doc_scraping.py\n'
+    text += '# (name, http method, path, private, ((param, type), ...), description)\n'
+    text += '\n'
+    text += 'ENDPOINTS = {\n'
+    print(text)
+    f.write(text)
     for cont, url in urls.items():
         r = requests.get(url)
         soup = bs4.BeautifulSoup(r.text, 'lxml')
-        text = ''
-        text += f'class {cont}:\n'
-        text += f'    def __init__(self, request: RESTAPI._request):\n'
-        text += f'        self._request = request\n'
-        text += f'\n'
+        text = f"    '{cont}': (\n"
         print(text)
         f.write(text)
 
         http_request = False
         request_parameters = False
-        # response_parameters = False
+        response_parameters = False
         desc = None
         method = None
         path = None
         params = []
+        fields = []
         table[cont] = []
         for element in soup.select_one('body > div.page-wrapper > div.content'):
             if isinstance(element, bs4.element.Tag):
@@ -62,35 +65,22 @@ with open('bybit_doc_scraping.txt', 'w') as f:
                                 idx = p_list.index(k)
                                 p_list[idx] = p_list[idx].replace(k, v)
                         funcname = '_'.join(p_list).replace('-', '').lower()
-                        private = 'True' if 'private' in funcname else 'False'
+                        private = 'private' in funcname
 
-                        text = ''
-                        text += f'    def {funcname}(\n'
-                        text += f'        self,\n'
-                        for p, t in params:
-                            p = p if not keyword.iskeyword(p) else f'{p}_'
-                            text += f'        {p}: {t.__name__}=None,\n'
-                        text += f'    ) -> requests.Response:\n'
-                        text += f'        """\n'
-                        text += f'        {desc}\n'
-                        text += f'        """\n'
-                        text += f"        method = '{method}'\n"
-                        text += f"        path = '{path}'\n"
-                        text += f"        query = {{\n"
-                        for p, t in params:
-                            _p = p if not keyword.iskeyword(p) else f'{p}_'
-                            text += f"            '{p}': {_p},\n"
-                        text += f"        }}\n"
-                        text += f'        return self._request(method, path, query, private={private})\n'
-                        text += '\n'
+                        # keyword parameter names (ex: 'from') are exposed as 'from_' by rest._Endpoint
+                        spec = (funcname, method, path, private, tuple(params), desc, )
+                        text = f'        {spec!r},\n'
                         print(text)
                         f.write(text)
 
                         table[cont] += [(funcname, method, path, desc, )]
+                        if fields:
+                            results.setdefault(path, tuple(fields))
 
                         method = None
                         path = None
                         params.clear()
+                        fields.clear()
                     desc = element.text
                     if desc == 'Abandoned Endpoints':
                         break
@@ -99,8 +89,8 @@ with open('bybit_doc_scraping.txt', 'w') as f:
                         http_request = True
                     elif element.text == 'Request Parameters':
                         request_parameters = True
-                    # elif element.text == 'Response Parameters':
-                    #     response_parameters = True
+                    elif element.text == 'Response Parameters':
+                        response_parameters = True
                 if http_request:
                     if element.name == 'p':
                         if element.select_one('code > span'):
@@ -115,8 +105,26 @@ with open('bybit_doc_scraping.txt', 'w') as f:
                             tr: bs4.element.Tag
                             tds: list[bs4.Tag] = list(tr.select('td'))
                             params.append((tds[0].text, type_mapping[tds[2].text], ))
-                # if response_parameters:
-                #     pass
+                if response_parameters:
+                    if element.name == 'table':
+                        response_parameters = False
+                        for tr in element.select('tbody > tr'):
+                            tds: list[bs4.Tag] = list(tr.select('td'))
+                            # nested objects/arrays are flattened into their rows, only scalars are kept
+                            if tds[1].text in type_mapping:
+                                fields.append((tds[0].text, type_mapping[tds[1].text], ))
+        text = '    ),\n'
+        print(text)
+        f.write(text)
+    text = '}\n'
+    text += '\n'
+    text += '# response fields (util/models.py): {path: ((field, type), ...)}\n'
+    text += 'RESULTS = {\n'
+    for path, spec in results.items():
+        text += f'    {path!r}: {spec!r},\n'
+    text += '}\n'
+    print(text)
+    f.write(text)
 
 text = ''
 text += '## メソッド名⇔エンドポイント名 対応表\n'
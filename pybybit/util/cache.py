@@ -0,0 +1,139 @@
+import asyncio
+import time
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from requests import Response
+from . import codec
+
+class ResponseCache:
+    _TTL = {
+        '/v2/public/symbols': 3600.0,
+        '/v2/public/risk-limit/list': 3600.0,
+        '/public/linear/risk-limit': 3600.0,
+        '/v2/public/announcement': 300.0,
+        '/v2/public/funding/prev-funding-rate': 60.0,
+        '/public/linear/funding/prev-funding-rate': 60.0,
+    }
+    _MAXSIZE = 256
+
+    def __init__(self, ttl: Dict[str, float]=None, maxsize: int=_MAXSIZE) -> None:
+        self._ttl = dict(self._TTL if ttl is None else ttl)
+        self._maxsize = maxsize
+        self._data: 'OrderedDict[Hashable, Tuple[float, Response]]' = OrderedDict()
+        self._lock = Lock()
+        self._events: Dict[Hashable, Event] = {}
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def key(self, method: str, path: str, query: dict) -> Optional[Hashable]:
+        if method != 'GET' or path not in self._ttl or '/private/' in path:
+            return None
+        return (path, tuple(sorted((k, v) for k, v in query.items() if v is not None)))
+
+    def _get(self, key: Hashable) -> Optional[Response]:
+        if key in self._data:
+            expires, resp = self._data[key]
+            if time.monotonic() < expires:
+                self._data.move_to_end(key)
+                return resp
+            del self._data[key]
+
+    @staticmethod
+    def _ok(resp: Response) -> bool:
+        # errors such as 10006/10016 come as HTTP 200 with a non-zero ret_code
+        if resp.status_code != 200:
+            return False
+        try:
+            content = codec.response_json(resp)
+        except ValueError:
+            return False
+        return isinstance(content, dict) and content.get('ret_code') == 0
+
+    def _set(self, key: Hashable, resp: Response) -> None:
+        if not self._ok(resp):
+            return
+        self._data[key] = (time.monotonic() + self._ttl[key[0]], resp)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def fetch(self, key: Hashable, func: Callable[[], Response]) -> Response:
+        while True:
+            with self._lock:
+                resp = self._get(key)
+                if resp is not None:
+                    self.hits += 1
+                    return resp
+                event = self._events.get(key)
+                if event is None:
+                    event = self._events[key] = Event()
+                    self.misses += 1
+                    break
+                self.coalesced += 1
+            event.wait()
+            with self._lock:
+                resp = self._get(key)
+                if resp is not None:
+                    return resp
+        try:
+            resp = func()
+            with self._lock:
+                self._set(key, resp)
+            return resp
+        finally:
+            with self._lock:
+                self._events.pop(key).set()
+
+    async def fetch_async(self, key: Hashable, func: Callable[[], Awaitable[Response]]) -> Response:
+        while True:
+            with self._lock:
+                resp = self._get(key)
+                if resp is not None:
+                    self.hits += 1
+                    return resp
+                future = self._futures.get(key)
+                if future is None:
+                    future = self._futures[key] = asyncio.get_running_loop().create_future()
+                    self.misses += 1
+                    break
+                self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            except Exception:
+                pass
+        try:
+            resp = await func()
+        except BaseException as e:
+            with self._lock:
+                self._futures.pop(key)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception() # retrieved: followers retry on their own
+            else:
+                future.cancel()
+            raise
+        with self._lock:
+            self._set(key, resp)
+            self._futures.pop(key)
+        future.set_result(resp)
+        return resp
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'size': len(self._data),
+                'maxsize': self._maxsize,
+            }
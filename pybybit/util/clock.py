@@ -0,0 +1,66 @@
+import time
+from collections import deque
+from threading import Lock, Thread
+from typing import Deque, Optional, Tuple
+from . import codec
+
+class Clock:
+    _MAXLEN = 8
+    _INTERVAL_SEC = 60.0
+
+    def __init__(self, maxlen: int=_MAXLEN) -> None:
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=maxlen)
+        self._lock = Lock()
+        self.offset = 0.0
+        self.rtt = 0.0
+        self.uncertainty: Optional[float] = None
+
+    def sample(self, t0: float, server: float, t1: float) -> None:
+        rtt = max(t1 - t0, 0.0)
+        offset = server - (t0 + t1) / 2
+        with self._lock:
+            self._samples.append((rtt, offset))
+            # NTP clock filter: the minimum-delay sample carries the least asymmetry error
+            rtt, offset = min(self._samples)
+            self.offset = offset
+            self.rtt = rtt
+            self.uncertainty = rtt / 2
+
+    def time(self) -> float:
+        return time.time() + self.offset
+
+    def timestamp(self) -> int:
+        # server time at which a request sent now is expected to arrive
+        return int((time.time() + self.offset + self.rtt / 2) * 1000)
+
+    def sample_rest(self, rest) -> None:
+        t0 = time.time()
+        resp = rest.inverse.public_time()
+        t1 = time.time()
+        self.sample(t0, float(codec.response_json(resp)['time_now']), t1)
+
+    async def sample_rest_async(self, rest) -> None:
+        t0 = time.time()
+        resp = await rest.inverse.public_time()
+        t1 = time.time()
+        self.sample(t0, float(codec.response_json(resp)['time_now']), t1)
+
+    def _loop(self, rest, interval: float) -> None:
+        while True:
+            try:
+                self.sample_rest(rest)
+            except Exception:
+                pass
+            time.sleep(interval)
+
+    def run_forever(self, rest, interval: float=_INTERVAL_SEC) -> None:
+        Thread(target=self._loop, args=[rest, interval], daemon=True).start()
+
+    async def run_forever_async(self, rest, interval: float=_INTERVAL_SEC) -> None:
+        import asyncio
+        while True:
+            try:
+                await self.sample_rest_async(rest)
+            except Exception:
+                pass
+            await asyncio.sleep(interval)
@@ -0,0 +1,79 @@
+import functools
+import json
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+if TYPE_CHECKING:
+    from requests import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def loads(s: Union[str, bytes]) -> Any:
+        return orjson.loads(s)
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    def loads(s: Union[str, bytes]) -> Any:
+        return json.loads(s)
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+def response_json(resp: 'Response') -> Any:
+    # decode the body once and share it between the library's own consumers
+    try:
+        return resp.__dict__['_pybybit_json']
+    except KeyError:
+        content = resp.__dict__['_pybybit_json'] = loads(resp.content)
+        return content
+
+class Message:
+    """
+    WebSocket frame decoded at most once and shared by every callback (treat it as read-only)
+    """
+    __slots__ = ('_raw', '_content', )
+
+    def __init__(self, raw: Union[str, bytes]) -> None:
+        self._raw = raw
+        self._content = None
+
+    @property
+    def raw(self) -> Union[str, bytes]:
+        return self._raw
+
+    @property
+    def content(self) -> Any:
+        if self._content is None:
+            self._content = loads(self._raw)
+        return self._content
+
+    @property
+    def topic(self) -> Optional[str]:
+        return self.content.get('topic')
+
+    @property
+    def type(self) -> Optional[str]:
+        return self.content.get('type')
+
+    @property
+    def data(self) -> Any:
+        return self.content.get('data')
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f'Message({self._raw!r})'
+
+def raw(func: Callable) -> Callable:
+    """
+    Wrap a callback that expects the raw frame for a client with decode enabled
+    """
+    @functools.wraps(func)
+    def wrapper(msg: Union[str, bytes, Message], ws: Any) -> Any:
+        return func(msg._raw if isinstance(msg, Message) else msg, ws)
+    return wrapper
@@ -0,0 +1,113 @@
+from threading import Condition, Lock, Thread
+from typing import Any, Dict, Optional, Tuple, Union
+from . import codec
+from .dispatch import _topic
+from .store import DataStore, Item
+
+class _Pending:
+    __slots__ = ('snapshot', 'levels', )
+
+    def __init__(self, snapshot: bool) -> None:
+        self.snapshot = snapshot
+        self.levels: Dict[Tuple[Any, str], Optional[Item]] = {} # None: deleted
+
+class OrderBookConflator:
+    """
+    WebSocket callback between WebScoketAPI and DataStore.orderbook for lagging consumers:
+    deltas queued for a symbol are merged into one net change (or one replacement snapshot) and applied
+    by a worker thread, so catching up costs the number of distinct levels, not the number of frames.
+    Other frames go to store.onmessage unchanged. Hold `lock` to read a consistent book.
+    """
+
+    def __init__(self, store: DataStore) -> None:
+        self._store = store
+        self._pending: Dict[str, _Pending] = {}
+        self._cond = Condition()
+        self._thread: Optional[Thread] = None
+        self.lock = Lock()
+        self.received = 0
+        self.merged = 0
+        self.applied = 0
+        self.errors = 0
+        self.exception: Optional[BaseException] = None
+
+    def __call__(self, msg: Union[str, bytes, codec.Message], ws: Any) -> None:
+        topic = _topic(msg)
+        if topic is None or not topic.startswith(('orderBookL2_25', 'orderBook_200', )):
+            self._store.onmessage(msg, ws)
+            return
+        content: Dict[str, Any] = msg.content if isinstance(msg, codec.Message) else codec.loads(msg)
+        type_, data = content.get('type'), content['data']
+        symbol = topic.split('.')[-1]
+        with self._cond:
+            # under the lock: a second worker could apply an older batch after a newer one
+            if self._thread is None:
+                self._thread = Thread(target=self._worker, daemon=True)
+                self._thread.start()
+            self.received += 1
+            if type_ == 'snapshot':
+                if isinstance(data, dict):
+                    data = data['order_book']
+                pending = _Pending(True)
+                for item in data:
+                    pending.levels[(item['id'], item['side'])] = item
+                self._pending[symbol] = pending
+            elif type_ == 'delta':
+                pending = self._pending.get(symbol)
+                if pending is None:
+                    pending = self._pending[symbol] = _Pending(False)
+                else:
+                    self.merged += 1
+                self._merge(pending, data)
+            self._cond.notify()
+
+    @staticmethod
+    def _merge(pending: _Pending, data: Dict[str, Any]) -> None:
+        levels = pending.levels
+        for item in data['delete']:
+            key = (item['id'], item['side'])
+            if pending.snapshot:
+                levels.pop(key, None)
+            else:
+                levels[key] = None
+        for item in data['update']:
+            key = (item['id'], item['side'])
+            prev = levels.get(key)
+            levels[key] = {**prev, **item} if prev is not None else item
+        for item in data['insert']:
+            levels[(item['id'], item['side'])] = item
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                pending, self._pending = self._pending, {}
+            try:
+                self._apply(pending)
+            except Exception as e:
+                self.errors += 1
+                self.exception = e
+
+    def _apply(self, pending: Dict[str, _Pending]) -> None:
+        orderbook = self._store.orderbook
+        with self.lock:
+            for symbol, p in pending.items():
+                if p.snapshot:
+                    orderbook._clear(symbol=symbol)
+                else:
+                    orderbook._pop([{'symbol': symbol, 'id': k[0], 'side': k[1]} for k, v in p.levels.items() if v is None])
+                orderbook._update([v for v in p.levels.values() if v is not None])
+                self.applied += 1
+        for event in self._store._events:
+            event.set()
+        self._store._events.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'pending': len(self._pending),
+            'received': self.received,
+            'merged': self.merged,
+            'applied': self.applied,
+            'errors': self.errors,
+        }
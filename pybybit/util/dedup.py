@@ -0,0 +1,98 @@
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from . import codec
+from .dispatch import _topic
+
+if TYPE_CHECKING:
+    from ..ws import Connection
+
+def _pattern(key: str) -> Tuple['re.Pattern', 're.Pattern']:
+    s = rf'"{key}":\s*"?([^",}}\s]+)'
+    return re.compile(s), re.compile(s.encode())
+
+_CROSS_SEQ = _pattern('cross_seq')
+_TIMESTAMP_E6 = _pattern('timestamp_e6')
+_TRADE_ID = _pattern('trade_id')
+_TYPE = _pattern('type')
+
+def _scan(msg: Union[str, bytes], pattern: Tuple['re.Pattern', 're.Pattern']) -> Optional[Union[str, bytes]]:
+    m = pattern[isinstance(msg, bytes)].search(msg)
+    return m.group(1) if m else None
+
+class Deduplicator:
+    """
+    First-arrival filter shared by redundant connections of the same topics (WebScoketAPI.run_redundant)
+    orderbook: passes only frames past the topic's highest (cross_seq, timestamp_e6); a later snapshot
+    only while no other connection of the group is up
+    trades: bounded seen set of (topic, trade_id), per trade; others: (topic, frame)
+    control frames (acks, pongs) pass only while no other connection of the group is up, so a
+    resubscribe ack does not clear DataStore under a live copy of the feed
+    """
+    _MAXLEN = 10000
+
+    def __init__(self, maxlen: int=_MAXLEN) -> None:
+        self._maxlen = maxlen
+        self._lock = Lock()
+        self._hwm: Dict[str, Tuple[int, int]] = {}
+        self._seen: OrderedDict = OrderedDict()
+        self.connections: List['Connection'] = []
+
+    def _see(self, key: tuple) -> bool:
+        if key in self._seen:
+            return False
+        self._seen[key] = None
+        if len(self._seen) > self._maxlen:
+            self._seen.popitem(last=False)
+        return True
+
+    def _trades(self, msg: Union[str, bytes, codec.Message], raw: Union[str, bytes], topic: str, ids: list) -> Optional[Union[str, bytes, codec.Message]]:
+        # per trade: connections may batch the same trades differently
+        new = {i for i in ids if self._see((topic, i))}
+        if len(new) == len(set(ids)):
+            return msg
+        elif not new:
+            return None
+        content = msg.content if isinstance(msg, codec.Message) else codec.loads(raw)
+        content = {**content, 'data': [row for row in content['data'] if str(row.get('trade_id')) in new]}
+        out = codec.dumps(content)
+        if isinstance(raw, bytes):
+            out = out.encode()
+        if isinstance(msg, codec.Message):
+            out = codec.Message(out)
+            out._content = content
+        return out
+
+    def _filter(self, msg: Union[str, bytes, codec.Message], conn: 'Connection') -> Optional[Union[str, bytes, codec.Message]]:
+        """
+        msg (or, for a trade batch partly seen, a frame with only its new trades) if it arrived first, else None
+        """
+        raw = msg.raw if isinstance(msg, codec.Message) else msg
+        topic = _topic(raw)
+        with self._lock:
+            if topic is None:
+                if any(c.connected for c in self.connections if c is not conn):
+                    return None
+                self._hwm.clear()
+                return msg
+            if topic.startswith(('orderBookL2_25', 'orderBook_200', )):
+                seq = (int(_scan(raw, _CROSS_SEQ) or 0), int(_scan(raw, _TIMESTAMP_E6) or 0))
+                out = msg if seq > self._hwm.get(topic, (-1, -1)) else None
+                if out is not None and topic in self._hwm and _scan(raw, _TYPE) in ('snapshot', b'snapshot', ):
+                    # a (re)subscribed member's snapshot would be upserted over the live book without a clear
+                    if any(c.connected for c in self.connections if c is not conn):
+                        out = None
+                if out is not None:
+                    self._hwm[topic] = seq
+            else:
+                ids = _TRADE_ID[isinstance(raw, bytes)].findall(raw)
+                if ids:
+                    out = self._trades(msg, raw, topic, [i.decode() if isinstance(i, bytes) else i for i in ids])
+                else:
+                    out = msg if self._see((topic, raw)) else None
+            if out is not None:
+                conn.wins += 1
+            else:
+                conn.duplicates += 1
+            return out
@@ -0,0 +1,193 @@
+import asyncio
+import itertools
+import queue
+from collections import OrderedDict, deque
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+from . import codec
+
+class Dispatcher:
+    """
+    Runs REST callbacks in order on a dedicated worker thread; flush() is a barrier for everything submitted before it
+    """
+
+    def __init__(self, maxsize: int=0) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+        self.errors = 0
+        self.exception: Optional[BaseException] = None
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._worker, daemon=True)
+                self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            callbacks, args = self._queue.get()
+            for cb in callbacks:
+                try:
+                    cb(*args)
+                except Exception as e:
+                    self.errors += 1
+                    self.exception = e
+
+    def submit(self, callbacks: Sequence[Callable], *args: Any) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put((tuple(callbacks), args))
+
+    def flush(self, timeout: float=None) -> bool:
+        if self._thread is None:
+            return True
+        event = Event()
+        self._queue.put(((event.set, ), ()))
+        return event.wait(timeout)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+class AsyncDispatcher:
+    """
+    Event loop task version of Dispatcher for AsyncRESTAPI; coroutine callbacks are awaited
+    """
+
+    def __init__(self, maxsize: int=0) -> None:
+        self._maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.errors = 0
+        self.exception: Optional[BaseException] = None
+
+    def _start(self) -> None:
+        self._queue = asyncio.Queue(self._maxsize)
+        self._task = asyncio.get_running_loop().create_task(self._worker())
+
+    async def _worker(self) -> None:
+        while True:
+            callbacks, args = await self._queue.get()
+            for cb in callbacks:
+                try:
+                    r = cb(*args)
+                    if asyncio.iscoroutine(r):
+                        await r
+                except Exception as e:
+                    self.errors += 1
+                    self.exception = e
+
+    def submit(self, callbacks: Sequence[Callable], *args: Any) -> None:
+        if self._task is None or self._task.done():
+            self._start()
+        self._queue.put_nowait((tuple(callbacks), args))
+
+    async def flush(self) -> None:
+        if self._task is None:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(((lambda: future.done() or future.set_result(None), ), ()))
+        await future
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+CONFLATE = 'conflate'
+
+def _topic(msg: Union[str, bytes]) -> Optional[str]:
+    if isinstance(msg, codec.Message):
+        return msg.topic
+    # "topic" value without a json decode
+    key, q = ('"topic":', '"') if isinstance(msg, str) else (b'"topic":', b'"')
+    i = msg.find(key)
+    if i < 0:
+        return None
+    i = msg.find(q, i + 8) + 1
+    topic = msg[i:msg.find(q, i)]
+    return topic if isinstance(topic, str) else topic.decode()
+
+class CallbackQueue:
+    """
+    Bounded queue and worker thread in front of one WebSocket callback, so a slow callback never stalls recv
+    policy: 'block' (recv waits for room), 'drop_oldest', 'conflate' (only the newest pending frame per topic)
+    """
+    _POLICIES = (BLOCK, DROP_OLDEST, CONFLATE, )
+
+    def __init__(self, func: Callable, maxsize: int=1024, policy: str=BLOCK) -> None:
+        if policy not in self._POLICIES:
+            raise ValueError(f'unsupported policy: {policy}')
+        self._func = func
+        self._maxsize = maxsize
+        self._policy = policy
+        self._items: Union[deque, OrderedDict] = OrderedDict() if policy == CONFLATE else deque()
+        self._counter = itertools.count()
+        self._cond = Condition()
+        self._thread: Optional[Thread] = None
+        self.received = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.errors = 0
+        self.exception: Optional[BaseException] = None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._items:
+                    self._cond.wait()
+                if self._policy == CONFLATE:
+                    _, item = self._items.popitem(last=False)
+                else:
+                    item = self._items.popleft()
+                self._cond.notify_all()
+            try:
+                self._func(*item)
+            except Exception as e:
+                self.errors += 1
+                self.exception = e
+
+    def __call__(self, msg: Union[str, bytes], ws: Any) -> None:
+        with self._cond:
+            # under the lock: recv threads of several connections may share this queue
+            if self._thread is None:
+                self._thread = Thread(target=self._worker, daemon=True)
+                self._thread.start()
+            self.received += 1
+            if self._policy == CONFLATE:
+                key = _topic(msg) or next(self._counter)
+                if key in self._items:
+                    self.conflated += 1
+                else:
+                    if self._maxsize and len(self._items) >= self._maxsize:
+                        self._items.popitem(last=False)
+                        self.dropped += 1
+                self._items[key] = (msg, ws)
+            else:
+                if self._maxsize and len(self._items) >= self._maxsize:
+                    if self._policy == BLOCK:
+                        while len(self._items) >= self._maxsize:
+                            self._cond.wait()
+                    else:
+                        self._items.popleft()
+                        self.dropped += 1
+                self._items.append((msg, ws))
+            self._cond.notify_all()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'policy': self._policy,
+            'qsize': len(self._items),
+            'received': self.received,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'errors': self.errors,
+        }
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+from .metrics import Histogram
+
+class Hedge:
+    _PATHS = (
+        '/v2/public/orderBook/L2',
+        '/v2/public/tickers',
+        '/v2/public/trading-records',
+        '/v2/public/kline/list',
+        '/v2/public/mark-price-kline',
+        '/v2/public/open-interest',
+        '/v2/public/time',
+        '/public/linear/kline',
+        '/public/linear/recent-trading-records',
+        '/public/linear/mark-price-kline',
+    )
+    _PERCENTILE = 0.95
+    _MIN_SAMPLES = 20
+    _DELAY_SEC = 0.5
+    _MAX_WORKERS = 16
+
+    def __init__(
+        self,
+        percentile: float=_PERCENTILE,
+        paths: Iterable[str]=_PATHS,
+        delay: float=_DELAY_SEC,
+        max_workers: int=_MAX_WORKERS,
+    ) -> None:
+        self._percentile = percentile
+        self._paths = frozenset(paths)
+        self._delay = delay
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+
+    def eligible(self, method: str, path: str, private: bool) -> bool:
+        return method == 'GET' and not private and path in self._paths
+
+    def delay(self, path: str) -> float:
+        h = self._histograms.get(path)
+        if h is None or h.count < self._MIN_SAMPLES:
+            return self._delay
+        return h.percentile(self._percentile)
+
+    def _record(self, path: str, elapsed: float, hedged: bool, win: bool) -> None:
+        with self._lock:
+            if path not in self._histograms:
+                self._histograms[path] = Histogram()
+            self._histograms[path].record(elapsed)
+            self.requests += 1
+            self.hedged += hedged
+            self.wins += win
+
+    def request(self, path: str, func: Callable[[], Any]) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        t0 = time.perf_counter()
+        first = self._executor.submit(func)
+        done, _ = wait([first], timeout=self.delay(path))
+        if done:
+            self._record(path, time.perf_counter() - t0, False, False)
+            return first.result()
+        second = self._executor.submit(func)
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                if f.exception() is None:
+                    self._record(path, time.perf_counter() - t0, True, f is second)
+                    for loser in pending:
+                        if not loser.cancel():
+                            loser.add_done_callback(self._discard)
+                    return f.result()
+                error = error or f.exception()
+        raise error
+
+    @staticmethod
+    def _discard(f: Future) -> None:
+        if not f.cancelled() and f.exception() is None and hasattr(f.result(), 'close'):
+            f.result().close()
+
+    async def request_async(self, path: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        t0 = time.perf_counter()
+        first = asyncio.ensure_future(func())
+        done, _ = await asyncio.wait({first}, timeout=self.delay(path))
+        if done:
+            self._record(path, time.perf_counter() - t0, False, False)
+            return first.result()
+        second = asyncio.ensure_future(func())
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    if t.exception() is None:
+                        self._record(path, time.perf_counter() - t0, True, t is second)
+                        return t.result()
+                    error = error or t.exception()
+            raise error
+        finally:
+            for t in pending:
+                t.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedged': self.hedged,
+                'wins': self.wins,
+                'hedge_rate': self.hedged / self.requests if self.requests else 0.0,
+                'win_rate': self.wins / self.hedged if self.hedged else 0.0,
+                'delay': {path: self.delay(path) for path in self._histograms},
+            }
@@ -0,0 +1,153 @@
+import asyncio
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Tuple
+from requests import Response
+from . import codec
+
+Item = Dict[str, Any]
+
+_INTERVALS = {
+    '1': 60, '3': 180, '5': 300, '15': 900, '30': 1800,
+    '60': 3600, '120': 7200, '240': 14400, '360': 21600, '720': 43200,
+    'D': 86400, 'W': 604800,
+}
+_LIMIT_KLINE = 200
+_LIMIT_PAGE = 50
+_LIMIT_TRADE = 1000
+_PREFETCH = 4
+
+def _rows(resp: Response) -> List[Item]:
+    content: Dict[str, Any] = codec.response_json(resp)
+    if content.get('ret_code') != 0:
+        raise RuntimeError(f"{content.get('ret_code')}: {content.get('ret_msg')}")
+    result = content.get('result')
+    if isinstance(result, list):
+        return result
+    elif isinstance(result, dict):
+        for k in ('data', 'trade_list', ):
+            if isinstance(result.get(k), list):
+                return result[k]
+    return []
+
+def _kline_pages(symbol: str, interval: str, start: int, end: int, limit: int) -> Iterator[Item]:
+    if interval not in _INTERVALS:
+        raise ValueError(f'unsupported interval: {interval}')
+    step = _INTERVALS[interval]
+    for from_ in range(start, end, step * limit):
+        yield {'symbol': symbol, 'interval': interval, 'from_': from_, 'limit': min(limit, -(-(end - from_) // step))}
+
+def _kline_filter(rows: List[Item], start: int, end: int) -> Iterator[Item]:
+    for row in rows:
+        t = row.get('open_time', row.get('start_at'))
+        if t is None or start <= t < end:
+            yield row
+
+def _prefetch(func: Callable, pages: Iterable[Item], prefetch: int) -> Iterator[Response]:
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque()
+        try:
+            for kwargs in pages:
+                pending.append(executor.submit(func, **kwargs))
+                if len(pending) >= prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for f in pending:
+                f.cancel()
+
+async def _aprefetch(func: Callable, pages: Iterable[Item], prefetch: int) -> AsyncIterator[Response]:
+    pending = deque()
+    try:
+        for kwargs in pages:
+            pending.append(asyncio.ensure_future(func(**kwargs)))
+            if len(pending) >= prefetch:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for t in pending:
+            t.cancel()
+
+def iter_kline(
+    func: Callable,
+    symbol: str,
+    interval: str,
+    start: int,
+    end: int,
+    limit: int=_LIMIT_KLINE,
+    prefetch: int=_PREFETCH,
+) -> Iterator[Item]:
+    """
+    Kline rows in [start, end) (unix seconds) for public_kline_list / public_kline / public_*kline
+    """
+    pages = _kline_pages(symbol, interval, start, end, limit)
+    for resp in _prefetch(func, pages, prefetch):
+        yield from _kline_filter(_rows(resp), start, end)
+
+async def aiter_kline(
+    func: Callable,
+    symbol: str,
+    interval: str,
+    start: int,
+    end: int,
+    limit: int=_LIMIT_KLINE,
+    prefetch: int=_PREFETCH,
+) -> AsyncIterator[Item]:
+    pages = _kline_pages(symbol, interval, start, end, limit)
+    async for resp in _aprefetch(func, pages, prefetch):
+        for row in _kline_filter(_rows(resp), start, end):
+            yield row
+
+def iter_pages(func: Callable, limit: int=_LIMIT_PAGE, prefetch: int=_PREFETCH, **kwargs) -> Iterator[Item]:
+    """
+    Rows of a page/limit endpoint (private_execution_list, private_trade_execution_list, ...)
+    """
+    pages = ({**kwargs, 'page': page, 'limit': limit} for page in itertools.count(1))
+    responses = _prefetch(func, pages, prefetch)
+    try:
+        for resp in responses:
+            rows = _rows(resp)
+            yield from rows
+            if len(rows) < limit:
+                break
+    finally:
+        responses.close()
+
+async def aiter_pages(func: Callable, limit: int=_LIMIT_PAGE, prefetch: int=_PREFETCH, **kwargs) -> AsyncIterator[Item]:
+    pages = ({**kwargs, 'page': page, 'limit': limit} for page in itertools.count(1))
+    responses = _aprefetch(func, pages, prefetch)
+    try:
+        async for resp in responses:
+            rows = _rows(resp)
+            for row in rows:
+                yield row
+            if len(rows) < limit:
+                break
+    finally:
+        await responses.aclose()
+
+def _next_trade(rows: List[Item], limit: int) -> Tuple[bool, int]:
+    return len(rows) >= limit, max(int(row['id']) for row in rows) + 1 if rows else 0
+
+def iter_trades(func: Callable, symbol: str, from_: int=None, limit: int=_LIMIT_TRADE) -> Iterator[Item]:
+    """
+    Rows of public_tradingrecords, paged by trade id (sequential: the next 'from' depends on the last page)
+    """
+    while True:
+        rows = _rows(func(symbol=symbol, from_=from_, limit=limit))
+        yield from rows
+        more, from_ = _next_trade(rows, limit)
+        if not more:
+            break
+
+async def aiter_trades(func: Callable, symbol: str, from_: int=None, limit: int=_LIMIT_TRADE) -> AsyncIterator[Item]:
+    while True:
+        rows = _rows(await func(symbol=symbol, from_=from_, limit=limit))
+        for row in rows:
+            yield row
+        more, from_ = _next_trade(rows, limit)
+        if not more:
+            break
@@ -0,0 +1,100 @@
+import math
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple
+
+class Histogram:
+    # log-linear buckets (frexp exponent x _SUB sub-buckets): ~3% relative error, O(1) record
+    _SUB = 16
+    _ZERO = -(1 << 30)
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        if value > 0.0:
+            m, e = math.frexp(value)
+            i = e * self._SUB + int((m - 0.5) * 2 * self._SUB)
+        else:
+            i = self._ZERO
+        self._counts[i] = self._counts.get(i, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def _value(self, i: int) -> float:
+        if i == self._ZERO:
+            return 0.0
+        e, r = divmod(i, self._SUB)
+        return math.ldexp(0.5 + (r + 0.5) / (2 * self._SUB), e)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        n = 0
+        for i in sorted(self._counts):
+            n += self._counts[i]
+            if n >= rank:
+                return min(self._value(i), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'p50': self.percentile(0.5),
+            'p99': self.percentile(0.99),
+            'p999': self.percentile(0.999),
+        }
+
+class RequestMetrics:
+    _STAGES = ('queue', 'sign', 'wire', 'ttfb', 'decode', 'callback', 'total', )
+
+    def __init__(self) -> None:
+        self._histograms: Dict[Tuple[str, int], Dict[str, Histogram]] = {}
+        self._lock = Lock()
+        self._callbacks: List[Callable[[str, int, Dict[str, float]], Any]] = []
+
+    def record(self, path: str, status: int, timings: Dict[str, float]) -> None:
+        with self._lock:
+            histograms = self._histograms.get((path, status))
+            if histograms is None:
+                histograms = self._histograms[(path, status)] = {stage: Histogram() for stage in self._STAGES}
+            for stage, value in timings.items():
+                histograms[stage].record(value)
+        for cb in self._callbacks:
+            cb(path, status, timings)
+
+    def add_callback(self, func) -> None:
+        if callable(func):
+            self._callbacks.append(func)
+
+    def histogram(self, path: str, status: int, stage: str) -> Histogram:
+        return self._histograms[(path, status)][stage]
+
+    def snapshot(self) -> Dict[Tuple[str, int], Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return {
+                key: {stage: h.snapshot() for stage, h in histograms.items() if h.count}
+                for key, histograms in self._histograms.items()
+            }
+
+    def export(self) -> str:
+        lines = ['# TYPE pybybit_rest_seconds summary']
+        for (path, status), stages in sorted(self.snapshot().items()):
+            for stage, s in stages.items():
+                labels = f'path="{path}",status="{status}",stage="{stage}"'
+                for q, k in (('0.5', 'p50'), ('0.99', 'p99'), ('0.999', 'p999')):
+                    lines.append(f'pybybit_rest_seconds{{{labels},quantile="{q}"}} {s[k]:.6f}')
+                lines.append(f'pybybit_rest_seconds_sum{{{labels}}} {s["mean"] * s["count"]:.6f}')
+                lines.append(f'pybybit_rest_seconds_count{{{labels}}} {s["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
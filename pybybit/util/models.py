@@ -0,0 +1,150 @@
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+from requests import Response
+from . import codec
+from ..endpoints import ENDPOINTS, RESULTS
+
+Item = Dict[str, Any]
+
+def _int(v: Any) -> int:
+    return v if isinstance(v, int) else int(float(v))
+
+def _bool(v: Any) -> bool:
+    return v if isinstance(v, bool) else str(v).lower() == 'true'
+
+_ARRAY_TYPECODES = {float: 'd', _int: 'q'}
+
+class _Field:
+    __slots__ = ('key', 'conv', 'slot', )
+
+    def __init__(self, key: str, conv: Callable, slot: str) -> None:
+        self.key = key
+        self.conv = conv
+        self.slot = slot
+
+    def __get__(self, obj: 'Model', owner: type) -> Any:
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            raw = obj._raw.get(self.key)
+            value = self.conv(raw) if raw is not None and raw != '' else None
+            setattr(obj, self.slot, value)
+            return value
+
+class _ModelMeta(type):
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        fields: Dict[str, Callable] = namespace.get('_FIELDS', {})
+        namespace['__slots__'] = tuple(namespace.get('__slots__', ())) + tuple(f'_v_{k}' for k in fields)
+        for k, conv in fields.items():
+            namespace[k] = _Field(k, conv, f'_v_{k}')
+        return super().__new__(mcs, name, bases, namespace)
+
+class Model(metaclass=_ModelMeta):
+    _FIELDS: Dict[str, Callable] = {}
+    __slots__ = ('_raw', )
+
+    def __init__(self, raw: Item) -> None:
+        self._raw = raw
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw[key]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._raw!r})'
+
+    def raw(self) -> Item:
+        return self._raw
+
+class ModelList(Sequence):
+    __slots__ = ('_model', '_raw', '_items', '_columns', )
+
+    def __init__(self, model: Type[Model], raw: List[Item]) -> None:
+        self._model = model
+        self._raw = raw
+        self._items: List[Optional[Model]] = [None] * len(raw)
+        self._columns: Dict[str, Union[array, list]] = {}
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        item = self._items[i]
+        if item is None:
+            item = self._items[i] = self._model(self._raw[i])
+        return item
+
+    def __iter__(self) -> Iterator[Model]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, key: str) -> Union[array, list]:
+        """
+        Whole column parsed once into a compact array ('d' for float fields, 'q' for int fields)
+        """
+        if key not in self._columns:
+            conv = self._model._FIELDS.get(key)
+            if conv in _ARRAY_TYPECODES:
+                nan = float('nan') if conv is float else 0
+                self._columns[key] = array(_ARRAY_TYPECODES[conv], (
+                    conv(v) if v is not None and v != '' else nan for v in (item.get(key) for item in self._raw)
+                ))
+            else:
+                self._columns[key] = [item.get(key) for item in self._raw]
+        return self._columns[key]
+
+    def raw(self) -> List[Item]:
+        return self._raw
+
+_CONVERTERS: Dict[str, Callable] = {'str': str, 'int': _int, 'float': float, 'bool': _bool}
+
+MODELS: Dict[str, Type[Model]] = {}
+
+def _model(name: str, endpoints: Tuple[str, ...]) -> Type[Model]:
+    # fields and paths come from the endpoint spec (endpoints.RESULTS / ENDPOINTS), matched by endpoint name
+    paths = [spec[2] for specs in ENDPOINTS.values() for spec in specs if spec[0] in endpoints and spec[2] in RESULTS]
+    fields: Dict[str, Callable] = {}
+    for path in paths:
+        fields.update((k, _CONVERTERS[t]) for k, t in RESULTS[path])
+    model = _ModelMeta(name, (Model, ), {'_FIELDS': fields, '__module__': __name__, '__qualname__': name})
+    for path in paths:
+        MODELS[path] = model
+    return model
+
+Kline = _model('Kline', (
+    'public_kline_list', 'public_kline', 'public_markpricekline', 'public_indexpricekline', 'public_premiumindexkline',
+))
+Ticker = _model('Ticker', ('public_tickers', ))
+OrderBookLevel = _model('OrderBookLevel', ('public_orderbook_l2', ))
+Trade = _model('Trade', ('public_tradingrecords', 'public_recenttradingrecords', ))
+Symbol = _model('Symbol', ('public_symbols', ))
+FundingRate = _model('FundingRate', ('public_funding_prevfundingrate', ))
+Order = _model('Order', ('private_order_list', 'private_order', 'private_order_search', ))
+Execution = _model('Execution', ('private_execution_list', 'private_trade_execution_list', ))
+Position = _model('Position', ('private_position_list', ))
+ClosedPnl = _model('ClosedPnl', ('private_trade_closedpnl_list', ))
+
+def parse(resp: Response, model: Type[Model]=None) -> Any:
+    """
+    Typed 'result' of a REST response: Model, ModelList, or the raw result when no model applies
+    """
+    result = codec.response_json(resp).get('result')
+    if model is None:
+        model = MODELS.get(resp.request.path_url.split('?', 1)[0])
+    if model is None:
+        return result
+    if isinstance(result, dict):
+        for k in ('data', 'trade_list', ):
+            if k in result and (isinstance(result[k], list) or result[k] is None):
+                result = result[k] or []
+                break
+    if isinstance(result, list):
+        if result and 'data' in result[0] and isinstance(result[0]['data'], dict):
+            result = [item['data'] for item in result]
+        return ModelList(model, result)
+    elif isinstance(result, dict):
+        return model(result)
+    return result
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List, Tuple
+from .bulk import CANCEL, CREATE, REPLACE
+
+Item = Dict[str, Any]
+Quote = Tuple[float, float] # (price, qty)
+
+class QuoteManager:
+    """
+    Keeps the live orders of a symbol/side equal to a desired quote ladder with the fewest requests
+
+    rest: RESTAPI or AsyncRESTAPI (update() is awaitable with the latter)
+    contract: rest.inverse / rest.linear / rest.futures
+    store: DataStore.order
+    """
+    _ACTIVE = ('Created', 'New', 'PartiallyFilled', )
+    _DEFAULTS = {'order_type': 'Limit', 'time_in_force': 'PostOnly'}
+
+    def __init__(self, rest, contract, store, max_workers: int=10, **params) -> None:
+        self._rest = rest
+        self._contract = contract
+        self._store = store
+        self._max_workers = max_workers
+        self._params = {**self._DEFAULTS, **params}
+
+    def _live(self, symbol: str, side: str) -> List[Item]:
+        return [
+            item for item in self._store.getlist(symbol=symbol, side=side)
+            if item.get('order_status', 'New') in self._ACTIVE
+        ]
+
+    def diff(self, symbol: str, side: str, quotes: List[Quote]) -> List[Tuple[str, Item]]:
+        live = sorted(self._live(symbol, side), key=lambda x: float(x['price']))
+        # compare as floats, send the caller's values as given (ex: int qty for inverse)
+        wanted = {}
+        for p, q in quotes:
+            wanted.setdefault((float(p), float(q)), []).append((p, q))
+        # unchanged orders are no-ops
+        rest_live = []
+        for item in live:
+            pq = (float(item['price']), float(item['qty']))
+            if wanted.get(pq):
+                wanted[pq].pop()
+            else:
+                rest_live.append(item)
+        wanted = [pq for k in sorted(wanted) for pq in wanted[k]]
+        actions = []
+        # remaining orders are moved in price order, extras are cancelled or created
+        for item, (price, qty) in zip(rest_live, wanted):
+            spec = {'order_id': item['order_id'], 'symbol': symbol}
+            if float(price) != float(item['price']):
+                spec['p_r_price'] = price
+            if float(qty) != float(item['qty']):
+                spec['p_r_qty'] = qty
+            actions.append((REPLACE, spec))
+        n = min(len(rest_live), len(wanted))
+        for item in rest_live[n:]:
+            actions.append((CANCEL, {'order_id': item['order_id'], 'symbol': symbol}))
+        for price, qty in wanted[n:]:
+            actions.append((CREATE, {**self._params, 'side': side, 'symbol': symbol, 'price': price, 'qty': qty}))
+        return actions
+
+    def update(self, symbol: str, side: str, quotes: List[Quote]):
+        funcs = {
+            CREATE: self._contract.private_order_create,
+            CANCEL: self._contract.private_order_cancel,
+            REPLACE: self._contract.private_order_replace,
+        }
+        calls = [(funcs[action], spec, action) for action, spec in self.diff(symbol, side, quotes)]
+        return self._rest.bulk_order(calls, self._store, self._max_workers)
@@ -0,0 +1,195 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from requests import Response
+from . import codec
+from ..endpoints import ENDPOINTS
+
+def _spec_group(name: str, method: str, private: bool) -> str:
+    if not private:
+        return 'public'
+    elif method == 'POST' and name.startswith(('private_order_', 'private_stoporder_', )):
+        return 'order'
+    elif name.startswith(('private_position_', 'private_tpsl_', )):
+        return 'position'
+    else:
+        return 'private'
+
+# (method, path) -> group, from the endpoint spec
+_GROUPS = {(spec[1], spec[2]): _spec_group(spec[0], spec[1], spec[3]) for specs in ENDPOINTS.values() for spec in specs}
+
+class _Bucket:
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset = 0.0
+
+    def take(self, floor: int) -> float:
+        if self.remaining is None:
+            return 0.0
+        now = time.time()
+        if now >= self.reset:
+            if self.limit is None:
+                # budget never reported (ex: a 403 ban): unknown again once the ban is over
+                self.remaining = None
+                return 0.0
+            self.remaining = self.limit
+        if self.remaining > floor:
+            self.remaining -= 1
+            return 0.0
+        return max(self.reset - now, RateLimiter._POLL_SEC)
+
+class RateLimiter:
+    _RESERVE = 2
+    _POLL_SEC = 0.05
+    _BAN_SEC = 5.0
+    _PRIORITY_CANCEL = 0
+    _PRIORITY_DEFAULT = 1
+
+    def __init__(self, reserve: int=_RESERVE) -> None:
+        self._reserve = reserve
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {} # Bybit reports a budget per endpoint
+        self._bans: Dict[str, float] = {} # 403: the whole group waits
+        self._queues: Dict[str, List[list]] = {}
+        self._counter = itertools.count()
+
+    @staticmethod
+    def group(method: str, path: str) -> str:
+        group = _GROUPS.get((method, path))
+        if group is not None:
+            return group
+        # paths outside the spec
+        if '/public/' in path:
+            return 'public'
+        elif method == 'POST' and ('/order/' in path or '/stop-order/' in path):
+            return 'order'
+        elif '/position/' in path or '/tpsl/' in path:
+            return 'position'
+        else:
+            return 'private'
+
+    @classmethod
+    def priority(cls, method: str, path: str) -> int:
+        return cls._PRIORITY_CANCEL if 'cancel' in path.lower() else cls._PRIORITY_DEFAULT
+
+    def _enter(self, group: str, priority: int, key: Tuple[str, str]) -> list:
+        ticket = [priority, next(self._counter), False, key] # [priority, order, rate-blocked, (method, path)]
+        with self._lock:
+            heapq.heappush(self._queues.setdefault(group, []), ticket)
+        return ticket
+
+    def _poll(self, group: str, ticket: list) -> float:
+        with self._lock:
+            queue = self._queues[group]
+            # only tickets waiting on their own endpoint's budget may be overtaken
+            if any(t < ticket and not t[2] for t in queue):
+                return self._POLL_SEC
+            cancel = ticket[0] == self._PRIORITY_CANCEL
+            # cancels go first across groups too, unless they are waiting on their own budget
+            if not cancel and any(q and q[0][0] == self._PRIORITY_CANCEL and not q[0][2] for q in self._queues.values()):
+                return self._POLL_SEC
+            delay = self._bans.get(group, 0.0) - time.time()
+            if delay <= 0.0:
+                bucket = self._buckets.get(ticket[3])
+                delay = bucket.take(0 if cancel else self._reserve) if bucket is not None else 0.0
+            if delay <= 0.0:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+            ticket[2] = delay > 0.0
+            return delay
+
+    def _leave(self, group: str, ticket: list) -> None:
+        with self._lock:
+            queue = self._queues[group]
+            if ticket in queue:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+
+    def acquire(self, method: str, path: str) -> None:
+        group = self.group(method, path)
+        ticket = self._enter(group, self.priority(method, path), (method, path))
+        try:
+            while True:
+                delay = self._poll(group, ticket)
+                if delay <= 0.0:
+                    break
+                time.sleep(min(delay, self._POLL_SEC))
+        except BaseException:
+            self._leave(group, ticket)
+            raise
+
+    async def acquire_async(self, method: str, path: str) -> None:
+        group = self.group(method, path)
+        ticket = self._enter(group, self.priority(method, path), (method, path))
+        try:
+            while True:
+                delay = self._poll(group, ticket)
+                if delay <= 0.0:
+                    break
+                await asyncio.sleep(min(delay, self._POLL_SEC))
+        except BaseException:
+            self._leave(group, ticket)
+            raise
+
+    def update(self, method: str, path: str, resp: Response) -> None:
+        limit = status = reset_ms = None
+        if 'X-Bapi-Limit-Status' in resp.headers:
+            limit = resp.headers.get('X-Bapi-Limit')
+            status = resp.headers.get('X-Bapi-Limit-Status')
+            reset_ms = resp.headers.get('X-Bapi-Limit-Reset-Timestamp')
+        else:
+            try:
+                content: Dict[str, Any] = codec.response_json(resp)
+            except ValueError:
+                content = {}
+            if isinstance(content, dict):
+                limit = content.get('rate_limit')
+                status = content.get('rate_limit_status')
+                reset_ms = content.get('rate_limit_reset_ms')
+                if content.get('ret_code') == 10006:
+                    status = 0
+        reset = int(reset_ms) / 1000 if reset_ms else None
+        if resp.status_code == 403:
+            with self._lock:
+                group = self.group(method, path)
+                self._bans[group] = max(self._bans.get(group, 0.0), reset or 0.0, time.time() + self._BAN_SEC)
+            return
+        if status is None:
+            return
+        with self._lock:
+            bucket = self._buckets.setdefault((method, path), _Bucket())
+            if limit is not None:
+                bucket.limit = int(limit)
+            if reset is not None and reset != bucket.reset:
+                bucket.remaining = int(status)
+                bucket.reset = reset
+            elif bucket.remaining is None:
+                bucket.remaining = int(status)
+            else:
+                bucket.remaining = min(bucket.remaining, int(status))
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            endpoints: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for (method, path), bucket in self._buckets.items():
+                endpoints.setdefault(self.group(method, path), {})[f'{method} {path}'] = {
+                    'limit': bucket.limit,
+                    'remaining': bucket.remaining,
+                    'reset': bucket.reset,
+                }
+            result = {}
+            for group in sorted(set(endpoints) | set(self._queues) | set(self._bans)):
+                known = [b for b in endpoints.get(group, {}).values() if b['remaining'] is not None]
+                # group figures: the most constrained endpoint
+                tightest = min(known, key=lambda b: b['remaining']) if known else {'limit': None, 'remaining': None, 'reset': 0.0}
+                result[group] = {
+                    **tightest,
+                    'banned_until': self._bans.get(group, 0.0),
+                    'waiting': len(self._queues.get(group, [])),
+                    'endpoints': endpoints.get(group, {}),
+                }
+            return result
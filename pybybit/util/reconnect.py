@@ -0,0 +1,52 @@
+import random
+import time
+
+class ReconnectPolicy:
+    """
+    Delay before each reconnect: immediate first retry, then full-jitter exponential backoff.
+    After `failures` consecutive short-lived connections the breaker opens and every further
+    attempt waits `cooldown` until a connection stays up for `stable` seconds.
+    """
+    _BASE_SEC = 0.5
+    _MAX_SEC = 30.0
+    _FACTOR = 2.0
+    _FAILURES = 10
+    _COOLDOWN_SEC = 60.0
+    _STABLE_SEC = 30.0
+
+    def __init__(
+        self,
+        base: float=_BASE_SEC,
+        max_: float=_MAX_SEC,
+        factor: float=_FACTOR,
+        failures: int=_FAILURES,
+        cooldown: float=_COOLDOWN_SEC,
+        stable: float=_STABLE_SEC,
+        seed: int=None,
+    ) -> None:
+        self._base = base
+        self._max = max_
+        self._factor = factor
+        self._failures = failures
+        self._cooldown = cooldown
+        self._stable = stable
+        self._random = random.Random(seed)
+        self.attempts = 0
+        self.reconnects = 0
+        self.open_until = 0.0
+
+    @property
+    def state(self) -> str:
+        return 'open' if time.time() < self.open_until else 'closed'
+
+    def delay(self, uptime: float) -> float:
+        if uptime >= self._stable:
+            self.attempts = 0
+        self.attempts += 1
+        self.reconnects += 1
+        if self.attempts == 1:
+            return 0.0
+        if self.attempts > self._failures:
+            self.open_until = time.time() + self._cooldown
+            return self._cooldown
+        return self._random.uniform(0.0, min(self._max, self._base * self._factor ** (self.attempts - 2)))
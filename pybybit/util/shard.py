@@ -0,0 +1,38 @@
+import zlib
+from typing import Dict, List
+
+# relative message rate per topic prefix (orderBook_200.100ms pushes far more than the rest)
+WEIGHTS = {
+    'orderBook_200': 20,
+    'orderBookL2_25': 10,
+    'trade': 5,
+    'instrument_info': 2,
+    'klineV2': 1,
+    'candle': 1,
+}
+
+def weight(topic: str, weights: Dict[str, int]=WEIGHTS) -> int:
+    return weights.get(topic.split('.', 1)[0], 1)
+
+def symbol(topic: str) -> str:
+    return topic.rsplit('.', 1)[-1]
+
+def shard(topics: List[str], n: int, by: str='weight', weights: Dict[str, int]=WEIGHTS) -> List[List[str]]:
+    """
+    Split topics into at most n groups
+    by='weight': greedy balance of WEIGHTS (heaviest topic to the lightest group)
+    by='symbol': crc32 of the symbol, so every topic of a symbol shares a connection
+    """
+    if by not in ('weight', 'symbol', ):
+        raise ValueError(f'unsupported shard key: {by}')
+    shards: List[List[str]] = [[] for _ in range(max(n, 1))]
+    if by == 'symbol':
+        for t in topics:
+            shards[zlib.crc32(symbol(t).encode()) % len(shards)].append(t)
+    else:
+        loads = [0] * len(shards)
+        for t in sorted(topics, key=lambda t: weight(t, weights), reverse=True):
+            i = loads.index(min(loads))
+            shards[i].append(t)
+            loads[i] += weight(t, weights)
+    return [s for s in shards if s]
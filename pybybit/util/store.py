@@ -1,9 +1,12 @@
-import json
 import urllib.parse
+from collections import OrderedDict
 from threading import Event
-from typing import Any, Dict, List, Optional, Union
-from requests import Response, Session
-from websocket import WebSocket
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from . import codec
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+    from websocket import WebSocket
 
 class DataStore:
     def __init__(self) -> None:
@@ -19,8 +22,8 @@ class DataStore:
         self.wallet = Wallet()
         self._events: List[Event] = []
 
-    def onresponse(self, resp: Response, session: Session) -> None:
-        content: Dict[str, Any] = resp.json()
+    def onresponse(self, resp: 'Response', session: 'Session') -> None:
+        content: Dict[str, Any] = codec.response_json(resp)
         if content.get('ret_code') == 0:
             # order
             if any([
@@ -50,8 +53,8 @@ class DataStore:
             elif resp.request.path_url.startswith('/v2/private/wallet/balance'):
                 self.wallet._onresponse(content['result'])
 
-    def onmessage(self, msg: str, ws: WebSocket) -> None:
-        content: Dict[str, Any] = json.loads(msg)
+    def onmessage(self, msg: Union[str, bytes, codec.Message], ws: 'WebSocket') -> None:
+        content: Dict[str, Any] = msg.content if isinstance(msg, codec.Message) else codec.loads(msg)
         if 'topic' in content:
             topic: str = content['topic']
             data: Union[List[Item], Item] = content['data']
@@ -86,6 +89,20 @@ class DataStore:
             for event in self._events:
                 event.set()
             self._events.clear()
+        elif content.get('success') and content.get('request', {}).get('op') == 'subscribe':
+            self._onsubscribe(content['request'].get('args') or [])
+
+    def _onsubscribe(self, topics: List[str]) -> None:
+        # (re)subscribed: drop state the new snapshot will replace, so nothing stale survives a reconnect
+        for topic in topics:
+            symbol = topic.split('.')[-1]
+            if any([
+                topic.startswith('orderBookL2_25'),
+                topic.startswith('orderBook_200'),
+            ]):
+                self.orderbook._clear(symbol=symbol)
+            elif topic.startswith('instrument_info'):
+                self.instrument._clear(symbol=symbol)
 
     def wait(self) -> None:
         event = Event()
@@ -152,7 +169,8 @@ class _KeyValueStore:
                 if key in self._data:
                     self._data[key].update(item)
                 else:
-                    self._data[key] = item
+                    # own copy: the item may belong to a frame shared with other callbacks (codec.Message)
+                    self._data[key] = dict(item)
             except KeyError:
                 pass
         if self._MAXLEN is not None:
@@ -183,6 +201,9 @@ class _KeyValueStore:
             event.set()
         self._events.clear()
 
+    def _clear(self, **kwargs) -> None:
+        self._pop(self.getlist(**kwargs))
+
     def wait(self) -> None:
         event = Event()
         self._events.append(event)
@@ -252,9 +273,7 @@ class Kline(_KeyValueStore):
 
     def _onmessage(self, topic: str, data: List[Item]) -> None:
         symbol = topic.split('.')[2] # ex:'klineV2.1.BTCUSD'
-        for item in data:
-            item['symbol'] = symbol
-        self._update(data)
+        self._update([{**item, 'symbol': symbol} for item in data])
 
 class Position:
     def __init__(self):
@@ -323,15 +342,28 @@ class Execution(_KeyValueStore):
 class Order(_KeyValueStore):
     _KEYS = ['order_id']
     _MAXLEN = None
+    _CLOSED_MAXLEN = 10000
+
+    def __init__(self) -> None:
+        super().__init__()
+        # ids the websocket already reported as closed: a late REST response must not revive them
+        self._closed: OrderedDict = OrderedDict()
+
+    def _close(self, order_id: str) -> None:
+        self._closed[order_id] = None
+        self._closed.move_to_end(order_id)
+        if len(self._closed) > self._CLOSED_MAXLEN:
+            self._closed.popitem(last=False)
 
     def _onresponse(self, data: List[Item]) -> None:
-        self._update(data)
+        self._update([item for item in data if item.get('order_id') not in self._closed])
 
     def _onmessage(self, data: List[Item]) -> None:
         for item in data:
             if item['order_status'] in ('Created', 'New', 'PartiallyFilled', ):
                 self._update([item])
             else:
+                self._close(item['order_id'])
                 self._pop([item])
 
 class StopOrder(_KeyValueStore):
@@ -343,6 +375,7 @@ class StopOrder(_KeyValueStore):
 
     def _onmessage(self, data: List[Item]) -> None:
         for item in data:
+            item = dict(item)
             if 'order_id' in item:
                 item['stop_order_id'] = item.pop('order_id')
             if 'order_status' in item:
@@ -0,0 +1,126 @@
+import asyncio
+import datetime
+import gzip
+import random
+import time
+import urllib.parse
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple, Union
+import requests
+from requests.structures import CaseInsensitiveDict
+from . import codec
+
+_VOLATILE = ('api_key', 'timestamp', 'sign', )
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def _key(method: str, url: str, data: Union[str, bytes, None]) -> str:
+    # signed requests differ by timestamp/signature on every call: match on the stable parameters only
+    u = urllib.parse.urlsplit(url)
+    query = u.query
+    if data:
+        query = data.decode() if isinstance(data, bytes) else data
+    params = sorted((k, v) for k, v in urllib.parse.parse_qsl(query, keep_blank_values=True) if k not in _VOLATILE)
+    return f'{method} {u.path}?{urllib.parse.urlencode(params)}'
+
+class Recorder:
+    """
+    REST callback (RESTAPI.add_callback) writing request/response pairs as JSON lines (gzip when path ends with .gz)
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = _open(path, 'a')
+        self._lock = Lock()
+
+    def onresponse(self, resp: requests.Response, session: Any) -> None:
+        req = resp.request
+        record = {
+            'key': _key(req.method, req.url, req.body),
+            'status': resp.status_code,
+            'headers': {k: v for k, v in resp.headers.items() if k.lower().startswith('x-bapi') or k.lower() == 'content-type'},
+            'body': resp.content.decode('utf-8'),
+            'elapsed': resp.elapsed.total_seconds() if resp.elapsed else 0.0,
+        }
+        line = codec.dumps(record)
+        with self._lock:
+            self._file.write(line + '\n')
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+class ReplayTransport:
+    """
+    Transport (RESTAPI.transport) answering from a Recorder file, with optional latency injection
+
+    latency: fixed seconds, 'recorded' to replay the recorded elapsed time, or a callable returning seconds
+    """
+
+    def __init__(
+        self,
+        path: str,
+        latency: Union[float, str, Callable[[], float]]=0.0,
+        jitter: float=0.0,
+        seed: int=0,
+    ) -> None:
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        with _open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    record = codec.loads(line)
+                    self._records.setdefault(record['key'], []).append(record)
+        self._index: Dict[str, int] = {}
+        self._latency = latency
+        self._jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = Lock()
+
+    def _next(self, method: str, url: str, data: Union[str, bytes, None]) -> Tuple[Dict[str, Any], float]:
+        key = _key(method, url, data)
+        with self._lock:
+            if key not in self._records:
+                raise LookupError(f'no recorded response for {key}')
+            records = self._records[key]
+            i = self._index.get(key, 0)
+            self._index[key] = i + 1
+            record = records[i % len(records)]
+            if callable(self._latency):
+                delay = self._latency()
+            elif self._latency == 'recorded':
+                delay = record['elapsed']
+            else:
+                delay = self._latency
+            if self._jitter:
+                delay += self._random.uniform(0.0, self._jitter)
+        return record, delay
+
+    @staticmethod
+    def _response(record: Dict[str, Any], delay: float, method: str, url: str, data, headers) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = record['status']
+        resp.headers = CaseInsensitiveDict(record['headers'])
+        resp._content = record['body'].encode('utf-8')
+        resp.encoding = 'utf-8'
+        resp.url = url
+        resp.request = requests.Request(method=method, url=url, data=data, headers=headers).prepare()
+        resp.elapsed = datetime.timedelta(seconds=delay)
+        return resp
+
+    def request(self, method: str, url: str, data=None, headers=None, **kwargs) -> requests.Response:
+        record, delay = self._next(method, url, data)
+        if delay > 0.0:
+            time.sleep(delay)
+        return self._response(record, delay, method, url, data, headers)
+
+    async def request_async(self, method: str, url: str, data=None, headers=None, **kwargs) -> requests.Response:
+        record, delay = self._next(method, url, data)
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+        return self._response(record, delay, method, url, data, headers)
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._index.clear()
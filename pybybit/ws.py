@@ -1,6 +1,106 @@
 import time
 import websocket
 from threading import Thread
+from typing import Any, Dict, List, Optional, Union
+from .util import codec
+from .util.dedup import Deduplicator
+from .util.dispatch import BLOCK, CallbackQueue, _topic
+from .util.metrics import Histogram
+from .util.reconnect import ReconnectPolicy
+from .util.shard import shard
+
+class Connection:
+    """
+    Counters of one WebSocket connection (WebScoketAPI.connections)
+    """
+
+    def __init__(self, wsurl: str, topics: list, dedup: Deduplicator=None) -> None:
+        self.wsurl = wsurl
+        self.topics = list(topics)
+        self.dedup = dedup
+        if dedup is not None:
+            dedup.connections.append(self)
+        self.wins = 0
+        self.duplicates = 0
+        self.connected = False
+        self.connects = 0
+        self.messages = 0
+        self.bytes = 0
+        self.since = 0.0
+        self.last_message = 0.0
+        self.last_topic: Dict[str, float] = {} # by subscribed topic
+        self._subscribed: Dict[str, str] = {}
+        self.rtt = Histogram()
+        self.ping_sent = 0.0 # oldest unanswered ping
+        self.ping_last = 0.0
+        self.stale = 0
+
+    def _onconnect(self) -> None:
+        self.connected = True
+        self.connects += 1
+        self.since = self.ping_last = time.time()
+        self.ping_sent = 0.0
+        self.last_topic.clear()
+
+    def _onmessage(self, msg: Union[str, bytes]) -> None:
+        now = time.time()
+        self.messages += 1
+        self.bytes += len(msg)
+        self.last_message = now
+        topic = _topic(msg)
+        if topic is not None:
+            self.last_topic[self._subscription(topic)] = now
+        elif self.ping_sent and (b'"pong"' if isinstance(msg, bytes) else '"pong"') in msg:
+            self.rtt.record(now - self.ping_sent)
+            self.ping_sent = 0.0
+
+    def _subscription(self, topic: str) -> str:
+        # pushed topic -> subscribed topic (ex: 'trade.BTCUSD' -> 'trade' or 'trade.*')
+        try:
+            return self._subscribed[topic]
+        except KeyError:
+            for t in self.topics:
+                base = t[:-2] if t.endswith('.*') else t
+                if topic == t or topic.startswith(base + '.'):
+                    break
+            else:
+                t = topic
+            self._subscribed[topic] = t
+            return t
+
+    def _onping(self) -> None:
+        self.ping_last = time.time()
+        if not self.ping_sent:
+            self.ping_sent = self.ping_last
+
+    def _stale(self, pong_timeout: float, stale_after: Dict[str, float]) -> Optional[str]:
+        # what went silent: 'pong', or a topic past its stale_after (keyed by topic or topic prefix)
+        now = time.time()
+        if self.ping_sent and now - self.ping_sent > pong_timeout:
+            return 'pong'
+        for topic in self.topics:
+            limit = stale_after.get(topic, stale_after.get(topic.split('.', 1)[0]))
+            if limit is not None and now - max(self.last_topic.get(topic, 0.0), self.since) > limit:
+                return topic
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'wsurl': self.wsurl,
+            'topics': self.topics,
+            'connected': self.connected,
+            'connects': self.connects,
+            'messages': self.messages,
+            'bytes': self.bytes,
+            'uptime': time.time() - self.since if self.connected else 0.0,
+            'last_message': self.last_message,
+            'idle': {topic: time.time() - t for topic, t in self.last_topic.items()},
+            'rtt': self.rtt.snapshot(),
+            'stale': self.stale,
+            'wins': self.wins,
+            'duplicates': self.duplicates,
+            'win_rate': self.wins / (self.wins + self.duplicates) if self.wins + self.duplicates else 0.0,
+        }
 
 class WebScoketAPI:
     _MAINNET_INVERSE = 'wss://stream.bybit.com/realtime'
@@ -25,63 +125,155 @@ class WebScoketAPI:
     _PUBLIC_TOPICS = [_ORDERBOOKL2_25, _ORDERBOOK_200, _TRADE, _INSTRUMENT_INFO, _KLINEV2, _CANDLE]
     _PRIVATE_TOPICS = [_POSITION, _EXECUTION, _ORDER, _STOPORDER, _WALLET]
     _HEARTBEAT_SEC = 30.0
-    _MINRECONECT_SEC = 60.0
+    _PONG_TIMEOUT_SEC = 10.0
+    _TICK_SEC = 1.0
 
     def __init__(self, auth, testnet) -> None:
         self._auth = auth
         self._testnet = testnet
         self._callbacks = []
+        self._reconnect_callbacks = []
+        self.binary = False
+        self.decode = False
+        self.ping_interval = self._HEARTBEAT_SEC
+        self.pong_timeout = self._PONG_TIMEOUT_SEC
+        self.stale_after: Dict[str, float] = {} # ex: {'orderBook_200': 5.0}: reconnect when silent longer
+        self.reconnect_policy = ReconnectPolicy
+        self.connections: List[Connection] = []
+        self.errors = 0
+        self.exception: Optional[BaseException] = None
 
-    def _subscribe(self, topics: list, ws: websocket.WebSocket) -> None:
+    def _command(self, op: str, topics: list) -> str:
         args = ','.join(f'"{t}"' for t in topics)
-        cmd = self._COMMAND.format(op='subscribe', args=args)
-        ws.send(cmd)
+        return self._COMMAND.format(op=op, args=args)
+
+    def _url(self, wsurl: str, topics: list) -> str:
+        if any(t in self._PRIVATE_TOPICS for t in topics):
+            param = self._auth._wssign()
+            return f'{wsurl}?{param}'
+        return wsurl
 
-    def _onmessage(self, ws: websocket.WebSocket) -> None:
-        Thread(target=self._heartbeat, args=[ws], daemon=True).start()
+    def _subscribe(self, topics: list, ws: websocket.WebSocket) -> None:
+        ws.send(self._command('subscribe', topics))
+
+    def _onmessage(self, ws: websocket.WebSocket, conn: Connection) -> None:
+        Thread(target=self._heartbeat, args=[ws, conn], daemon=True).start()
         while True:
             try:
-                msg: str = ws.recv()
+                msg = self._recv(ws)
             except Exception:
                 break
             else:
+                conn._onmessage(msg)
+                if conn.dedup is not None:
+                    msg = conn.dedup._filter(msg, conn)
+                    if msg is None:
+                        continue
+                if self.decode:
+                    msg = codec.Message(msg)
                 for cb in self._callbacks:
-                    cb(msg, ws)
+                    try:
+                        cb(msg, ws)
+                    except Exception as e:
+                        # a failing callback must not drop the connection (the resubscribe would clear stores)
+                        self.errors += 1
+                        self.exception = e
 
-    def _heartbeat(self, ws: websocket.WebSocket) -> None:
-        while True:
-            time.sleep(self._HEARTBEAT_SEC)
-            try:
-                ws.send('{"op":"ping"}')
-            except Exception:
+    def _recv(self, ws: websocket.WebSocket) -> Union[str, bytes]:
+        if self.binary:
+            # hand the raw frame to callbacks without a str decode (DataStore.onmessage accepts bytes)
+            opcode, data = ws.recv_data()
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                raise websocket.WebSocketConnectionClosedException()
+            return data
+        return ws.recv()
+
+    def _heartbeat(self, ws: websocket.WebSocket, conn: Connection) -> None:
+        n = conn.connects
+        while conn.connected and conn.connects == n:
+            time.sleep(min(self.ping_interval, self._TICK_SEC))
+            if conn._stale(self.pong_timeout, self.stale_after) is not None:
+                # half-open or frozen feed: drop the socket, recv fails and _loop reconnects
+                conn.stale += 1
+                ws.abort()
                 break
+            if time.time() - conn.ping_last >= self.ping_interval:
+                conn._onping()
+                try:
+                    ws.send('{"op":"ping"}')
+                except Exception:
+                    break
 
-    def _loop(self, wsurl: str, topics: list) -> None:
+    def _loop(self, wsurl: str, topics: list, dedup: Deduplicator=None) -> None:
+        policy = self.reconnect_policy()
+        conn = Connection(wsurl, topics, dedup)
+        self.connections.append(conn)
         while True:
             t = time.time()
             try:
-                if any(t in self._PRIVATE_TOPICS for t in topics):
-                    param = self._auth._wssign()
-                    wsurl += f'?{param}'
-                ws = websocket.create_connection(wsurl)
+                ws = websocket.create_connection(self._url(wsurl, topics))
                 self._subscribe(topics, ws)
-                self._onmessage(ws)
+                conn._onconnect()
+                if conn.connects > 1:
+                    for cb in self._reconnect_callbacks:
+                        try:
+                            cb(topics, ws)
+                        except Exception as e:
+                            self.errors += 1
+                            self.exception = e
+                self._onmessage(ws, conn)
             except KeyboardInterrupt:
                 break
-            time.sleep(max(self._MINRECONECT_SEC - (time.time() - t), 0))
+            except Exception:
+                pass
+            conn.connected = False
+            time.sleep(policy.delay(time.time() - t))
 
-    def add_callback(self, func) -> None:
+    def add_callback(self, func, maxsize: int=None, policy: str=BLOCK, raw: bool=False) -> Optional[CallbackQueue]:
+        """
+        maxsize: run func on its own worker behind a CallbackQueue (returned, for qsize/metrics) instead of on recv
+        raw: func gets the frame as received even with decode enabled (codec.Message otherwise)
+        """
         if callable(func):
+            if raw:
+                func = codec.raw(func)
+            if maxsize is not None:
+                func = CallbackQueue(func, maxsize, policy)
             self._callbacks.append(func)
+            return func if maxsize is not None else None
+
+    def add_reconnect_callback(self, func) -> None:
+        """
+        func(topics, ws) runs after a reconnect has resubscribed (ex: REST resync of private stores)
+        """
+        if callable(func):
+            self._reconnect_callbacks.append(func)
+
+    def run_sharded(self, run, topics: list, shards: int, by: str='weight') -> list:
+        """
+        Spread topics over up to `shards` connections opened with run (ex: self.run_forever_linear_public)
+        """
+        return [run(t) for t in shard(topics, shards, by)]
+
+    def run_redundant(self, run, topics: list, n: int=2) -> list:
+        """
+        Open n identical connections with run; only the first copy of each frame reaches the callbacks
+        (per-connection wins/win_rate in metrics())
+        """
+        dedup = Deduplicator()
+        return [run(topics, dedup) for _ in range(n)]
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        return [conn.snapshot() for conn in self.connections]
 
-    def run_forever_inverse(self, topics: list) -> None:
+    def run_forever_inverse(self, topics: list, dedup: Deduplicator=None) -> None:
         wsurl = self._MAINNET_INVERSE if not self._testnet else self._TESTNET_INVERSE
-        Thread(target=self._loop, args=[wsurl, topics], daemon=True).start()
+        Thread(target=self._loop, args=[wsurl, topics, dedup], daemon=True).start()
 
-    def run_forever_linear_public(self, topics: list) -> None:
+    def run_forever_linear_public(self, topics: list, dedup: Deduplicator=None) -> None:
         wsurl = self._MAINNET_LINEAR_PUBLIC if not self._testnet else self._TESTNET_LINEAR_PUBLIC
-        Thread(target=self._loop, args=[wsurl, topics], daemon=True).start()
+        Thread(target=self._loop, args=[wsurl, topics, dedup], daemon=True).start()
 
-    def run_forever_linear_private(self, topics: list) -> None:
+    def run_forever_linear_private(self, topics: list, dedup: Deduplicator=None) -> None:
         wsurl = self._MAINNET_LINEAR_PRIVATE if not self._testnet else self._TESTNET_LINEAR_PRIVATE
-        Thread(target=self._loop, args=[wsurl, topics], daemon=True).start()
+        Thread(target=self._loop, args=[wsurl, topics, dedup], daemon=True).start()
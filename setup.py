@@ -9,5 +9,6 @@ setup(
     description='Bybit API client library for Python',
     author='MtkN1XBt',
     url='https://github.com/MtkN1/pybybit',
-    install_requires=['requests', 'websocket_client']
+    install_requires=['requests', 'websocket_client'],
+    extras_require={'async': ['aiohttp'], 'fast': ['orjson']}
 )
@@ -0,0 +1,40 @@
+from pybybit.util.bulk import CANCEL, CREATE, REPLACE, BulkResult, _reflect
+from pybybit.util.store import Order
+
+def _created(order_id, status='Created'):
+    return {'order_id': order_id, 'symbol': 'BTCUSD', 'side': 'Buy', 'price': '100', 'qty': 1, 'order_status': status}
+
+def _result(spec, ret_code=0, result=None):
+    return BulkResult(spec, None, {'ret_code': ret_code, 'ret_msg': '', 'result': result}, None)
+
+def test_create_reflected():
+    order = Order()
+    _reflect(order, _result({}, result=_created('a')), CREATE)
+    assert order.get(order_id='a')['order_status'] == 'Created'
+
+def test_create_after_ws_close_not_revived():
+    order = Order()
+    order._onmessage([_created('a', 'New')])
+    order._onmessage([_created('a', 'Filled')])
+    _reflect(order, _result({}, result=_created('a')), CREATE)
+    assert order.get(order_id='a') is None
+    assert len(order) == 0
+
+def test_replace_applies_price():
+    order = Order()
+    order._onmessage([_created('a', 'New')])
+    _reflect(order, _result({'order_id': 'a', 'p_r_price': '101'}, result={'order_id': 'a'}), REPLACE)
+    assert order.get(order_id='a')['price'] == '101'
+
+def test_order_gone_error_pops():
+    order = Order()
+    order._onmessage([_created('a', 'New'), _created('b', 'New')])
+    _reflect(order, _result({'order_id': 'a'}, ret_code=20001), CANCEL)
+    _reflect(order, _result({'order_id': 'b'}, ret_code=130010), REPLACE)
+    assert len(order) == 0
+
+def test_other_error_keeps_order():
+    order = Order()
+    order._onmessage([_created('a', 'New')])
+    _reflect(order, _result({'order_id': 'a'}, ret_code=10006), CANCEL)
+    assert order.get(order_id='a') is not None
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import threading
+import time
+import requests
+from pybybit.util.cache import ResponseCache
+
+def _response(ret_code: int=0, status: int=200) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps({'ret_code': ret_code, 'result': []}).encode()
+    return resp
+
+def _key(cache: ResponseCache):
+    return cache.key('GET', '/v2/public/symbols', {})
+
+def test_hit_within_ttl():
+    cache = ResponseCache()
+    calls = []
+    fetch = lambda: calls.append(1) or _response()
+    first = cache.fetch(_key(cache), fetch)
+    assert cache.fetch(_key(cache), fetch) is first
+    assert len(calls) == 1 and cache.stats()['hits'] == 1
+
+def test_expires_after_ttl():
+    cache = ResponseCache(ttl={'/v2/public/symbols': 0.05})
+    calls = []
+    fetch = lambda: calls.append(1) or _response()
+    cache.fetch(_key(cache), fetch)
+    time.sleep(0.1)
+    cache.fetch(_key(cache), fetch)
+    assert len(calls) == 2
+
+def test_errors_not_cached():
+    cache = ResponseCache()
+    calls = []
+    for resp in (_response(ret_code=10006), _response(status=403), _response(ret_code=10016)):
+        cache.fetch(_key(cache), lambda: calls.append(1) or resp)
+    assert len(calls) == 3 and cache.stats()['size'] == 0
+
+def test_private_and_uncached_paths_have_no_key():
+    cache = ResponseCache()
+    assert cache.key('GET', '/v2/private/order', {}) is None
+    assert cache.key('GET', '/v2/public/tickers', {}) is None
+    assert cache.key('GET', '/v2/public/symbols', {'a': None}) == cache.key('GET', '/v2/public/symbols', {})
+
+def test_single_flight():
+    cache = ResponseCache()
+    calls = []
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return _response()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.fetch(_key(cache), fetch))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1 and len(results) == 5 and len({id(r) for r in results}) == 1
+    assert cache.stats()['coalesced'] == 4
+
+def test_single_flight_async():
+    cache = ResponseCache()
+    calls = []
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return _response()
+    async def main():
+        return await asyncio.gather(*(cache.fetch_async(_key(cache), fetch) for _ in range(5)))
+    results = asyncio.run(main())
+    assert len(calls) == 1 and len({id(r) for r in results}) == 1
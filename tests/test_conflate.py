@@ -0,0 +1,81 @@
+import json
+import random
+import time
+from pybybit.util import codec
+from pybybit.util.conflate import OrderBookConflator, _Pending
+from pybybit.util.store import DataStore
+
+TOPIC = 'orderBookL2_25.BTCUSD'
+
+def _level(id_, side, size):
+    return {'symbol': 'BTCUSD', 'id': id_, 'side': side, 'price': str(id_ / 2), 'size': size}
+
+def _snapshot():
+    return [_level(i, 'Buy' if i < 10 else 'Sell', 1) for i in range(20)]
+
+def _deltas(n, seed=0):
+    rnd = random.Random(seed)
+    book = {(i, 'Buy' if i < 10 else 'Sell') for i in range(20)}
+    for _ in range(n):
+        delta = {'delete': [], 'update': [], 'insert': []}
+        for key in rnd.sample(sorted(book), min(2, len(book) - 3)):
+            book.discard(key)
+            delta['delete'].append({'symbol': 'BTCUSD', 'id': key[0], 'side': key[1]})
+        for key in rnd.sample(sorted(book), 3):
+            delta['update'].append({'symbol': 'BTCUSD', 'id': key[0], 'side': key[1], 'size': rnd.randint(1, 100)})
+        for _ in range(3):
+            id_ = rnd.randint(0, 40)
+            side = 'Buy' if id_ < 10 else 'Sell'
+            if (id_, side) not in book:
+                book.add((id_, side))
+                delta['insert'].append(_level(id_, side, rnd.randint(1, 100)))
+        yield delta
+
+def _book(store):
+    return sorted(store.orderbook.getlist(), key=lambda x: (x['side'], x['id']))
+
+def test_merged_deltas_equal_direct_application():
+    direct, conflated = DataStore(), DataStore()
+    direct.orderbook._onmessage('snapshot', _snapshot())
+    conflated.orderbook._onmessage('snapshot', _snapshot())
+    pending = _Pending(False)
+    for delta in _deltas(200):
+        direct.orderbook._onmessage('delta', delta)
+        OrderBookConflator._merge(pending, delta)
+    OrderBookConflator(conflated)._apply({'BTCUSD': pending})
+    assert _book(conflated) == _book(direct)
+
+def test_deltas_merged_into_snapshot():
+    direct, conflated = DataStore(), DataStore()
+    conflated.orderbook._onmessage('delta', {'delete': [], 'update': [], 'insert': [_level(99, 'Sell', 1)]})
+    direct.orderbook._onmessage('snapshot', _snapshot())
+    pending = _Pending(True)
+    for item in _snapshot():
+        pending.levels[(item['id'], item['side'])] = item
+    for delta in _deltas(50, seed=1):
+        direct.orderbook._onmessage('delta', delta)
+        OrderBookConflator._merge(pending, delta)
+    OrderBookConflator(conflated)._apply({'BTCUSD': pending})
+    # the snapshot replaces the level that was there before it
+    assert conflated.orderbook.get(symbol='BTCUSD', id=99, side='Sell') is None
+    assert _book(conflated) == _book(direct)
+
+def test_worker_applies_frames():
+    store = DataStore()
+    conflator = OrderBookConflator(store)
+    conflator(codec.Message(json.dumps({'topic': TOPIC, 'type': 'snapshot', 'data': _snapshot()})), None)
+    for delta in _deltas(20, seed=2):
+        conflator(codec.Message(json.dumps({'topic': TOPIC, 'type': 'delta', 'data': delta})), None)
+    direct = DataStore()
+    direct.orderbook._onmessage('snapshot', _snapshot())
+    for delta in _deltas(20, seed=2):
+        direct.orderbook._onmessage('delta', delta)
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        with conflator.lock:
+            if _book(store) == _book(direct):
+                break
+        time.sleep(0.01)
+    with conflator.lock:
+        assert _book(store) == _book(direct)
+    assert conflator.errors == 0
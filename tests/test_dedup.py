@@ -0,0 +1,72 @@
+import json
+from pybybit.util import codec
+from pybybit.util.dedup import Deduplicator
+from pybybit.util.store import DataStore
+from pybybit.ws import Connection
+
+def _trades(*ids: str) -> str:
+    return json.dumps({'topic': 'trade.BTCUSD', 'data': [{'trade_id': i, 'symbol': 'BTCUSD'} for i in ids]})
+
+def _ids(msg) -> list:
+    content = msg.content if isinstance(msg, codec.Message) else json.loads(msg)
+    return [row['trade_id'] for row in content['data']]
+
+def _group():
+    dedup = Deduplicator()
+    return dedup, Connection('a', ['trade.BTCUSD'], dedup), Connection('b', ['trade.BTCUSD'], dedup)
+
+def test_trades_larger_batch_first():
+    dedup, a, b = _group()
+    assert _ids(dedup._filter(_trades('t1', 't2'), b)) == ['t1', 't2']
+    assert dedup._filter(_trades('t1'), a) is None
+    assert dedup._filter(_trades('t2'), a) is None
+
+def test_trades_smaller_batch_first():
+    dedup, a, b = _group()
+    assert _ids(dedup._filter(_trades('t1'), a)) == ['t1']
+    # t2 is new: delivered now instead of waiting for a
+    assert _ids(dedup._filter(_trades('t1', 't2'), b)) == ['t2']
+    assert dedup._filter(_trades('t2'), a) is None
+    assert (a.wins, a.duplicates, b.wins, b.duplicates) == (1, 1, 1, 0)
+
+def test_trades_partial_batch_keeps_frame_type():
+    dedup, a, b = _group()
+    dedup._filter(_trades('t1'), a)
+    out = dedup._filter(codec.Message(_trades('t1', 't2').encode()), b)
+    assert isinstance(out, codec.Message) and isinstance(out.raw, bytes)
+    assert _ids(out) == ['t2'] and _ids(codec.Message(out.raw)) == ['t2']
+    out = dedup._filter(_trades('t2', 't3').encode(), a)
+    assert isinstance(out, bytes) and _ids(out) == ['t3']
+
+def test_orderbook_first_arrival_by_sequence():
+    dedup, a, b = _group()
+    frame = lambda seq: json.dumps({'topic': 'orderBook_200.100ms.BTCUSD', 'type': 'delta', 'cross_seq': seq, 'timestamp_e6': seq})
+    assert dedup._filter(frame(1), a) is not None
+    assert dedup._filter(frame(1), b) is None
+    assert dedup._filter(frame(2), b) is not None
+    assert dedup._filter(frame(2), a) is None
+
+def test_orderbook_snapshot_from_resubscribed_connection():
+    dedup, a, b = _group()
+    a.connected = b.connected = True
+    def frame(type_, seq, data):
+        return json.dumps({'topic': 'orderBook_200.100ms.BTCUSD', 'type': type_, 'data': data, 'cross_seq': seq, 'timestamp_e6': seq})
+    level = lambda i: {'price': str(i), 'symbol': 'BTCUSD', 'id': i, 'side': 'Buy', 'size': 1}
+    store = DataStore()
+    for msg, conn in [
+        (frame('snapshot', 1, [level(1), level(2)]), a),
+        (frame('snapshot', 2, [level(1)]), b),
+        (frame('delta', 2, {'delete': [level(2)], 'update': [], 'insert': []}), a),
+        (frame('delta', 2, {'delete': [level(2)], 'update': [], 'insert': []}), b),
+    ]:
+        out = dedup._filter(msg, conn)
+        if out is not None:
+            store.onmessage(out, None)
+    assert [item['id'] for item in store.orderbook.getlist()] == [1]
+
+def test_orderbook_snapshot_passes_when_alone():
+    dedup, a, b = _group()
+    a.connected, b.connected = False, True
+    frame = json.dumps({'topic': 'orderBook_200.100ms.BTCUSD', 'type': 'snapshot', 'data': [], 'cross_seq': 1})
+    assert dedup._filter(frame, b) is not None
+    assert dedup._filter(frame.replace('"cross_seq": 1', '"cross_seq": 5'), b) is not None
@@ -0,0 +1,45 @@
+from pybybit.util.bulk import CANCEL, CREATE, REPLACE
+from pybybit.util.quote import QuoteManager
+from pybybit.util.store import Order
+
+def _manager(*orders):
+    store = Order()
+    store._onresponse([
+        {'order_id': order_id, 'symbol': 'BTCUSD', 'side': 'Buy', 'price': price, 'qty': qty, 'order_status': 'New'}
+        for order_id, price, qty in orders
+    ])
+    return QuoteManager(None, None, store)
+
+def test_unchanged_is_noop():
+    manager = _manager(('a', '100', 1), ('b', '99.5', 2))
+    assert manager.diff('BTCUSD', 'Buy', [(99.5, 2), (100, 1)]) == []
+
+def test_moved_orders_replaced():
+    manager = _manager(('a', '100', 1), ('b', '99.5', 2))
+    actions = manager.diff('BTCUSD', 'Buy', [(100, 1), (99, 2)])
+    assert actions == [(REPLACE, {'order_id': 'b', 'symbol': 'BTCUSD', 'p_r_price': 99})]
+
+def test_qty_change_replaced():
+    manager = _manager(('a', '100', 1))
+    assert manager.diff('BTCUSD', 'Buy', [(100, 3)]) == [(REPLACE, {'order_id': 'a', 'symbol': 'BTCUSD', 'p_r_qty': 3})]
+
+def test_extras_cancelled():
+    manager = _manager(('a', '100', 1), ('b', '99.5', 2), ('c', '99', 1))
+    actions = manager.diff('BTCUSD', 'Buy', [(100, 1)])
+    assert sorted(spec['order_id'] for action, spec in actions if action == CANCEL) == ['b', 'c']
+    assert all(action == CANCEL for action, _ in actions)
+
+def test_new_levels_created():
+    manager = _manager(('a', '100', 1))
+    actions = manager.diff('BTCUSD', 'Buy', [(100, 1), (98, 5)])
+    assert actions == [(CREATE, {
+        'order_type': 'Limit', 'time_in_force': 'PostOnly', 'side': 'Buy', 'symbol': 'BTCUSD', 'price': 98, 'qty': 5,
+    })]
+
+def test_other_side_and_closed_orders_ignored():
+    manager = _manager(('a', '100', 1))
+    manager._store._onresponse([
+        {'order_id': 's', 'symbol': 'BTCUSD', 'side': 'Sell', 'price': '101', 'qty': 1, 'order_status': 'New'},
+        {'order_id': 'f', 'symbol': 'BTCUSD', 'side': 'Buy', 'price': '97', 'qty': 1, 'order_status': 'Filled'},
+    ])
+    assert manager.diff('BTCUSD', 'Buy', [(100, 1)]) == []
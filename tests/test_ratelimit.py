@@ -0,0 +1,67 @@
+import json
+import threading
+import time
+import requests
+from pybybit.util.ratelimit import RateLimiter
+
+def _response(status: int=200, **content) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps(content).encode() if content else b'<html>forbidden</html>'
+    return resp
+
+def _elapsed(func) -> float:
+    t = time.time()
+    func()
+    return time.time() - t
+
+def test_cancel_not_blocked_by_create_budget():
+    limiter = RateLimiter()
+    reset_ms = int((time.time() + 3.0) * 1000)
+    limiter.update('POST', '/v2/private/order/create', _response(rate_limit=100, rate_limit_status=0, rate_limit_reset_ms=reset_ms))
+    assert _elapsed(lambda: limiter.acquire('POST', '/v2/private/order/cancel')) < 0.5
+
+def test_exhausted_endpoint_waits_for_reset():
+    limiter = RateLimiter()
+    reset_ms = int((time.time() + 0.3) * 1000)
+    limiter.update('POST', '/v2/private/order/create', _response(rate_limit=100, rate_limit_status=0, rate_limit_reset_ms=reset_ms))
+    assert 0.2 < _elapsed(lambda: limiter.acquire('POST', '/v2/private/order/create')) < 1.0
+    metrics = limiter.metrics()['order']
+    assert metrics['endpoints']['POST /v2/private/order/create']['limit'] == 100
+
+def test_reserve_kept_for_cancels():
+    limiter = RateLimiter(reserve=2)
+    reset_ms = int((time.time() + 0.3) * 1000)
+    limiter.update('POST', '/v2/private/order/cancel', _response(rate_limit=100, rate_limit_status=2, rate_limit_reset_ms=reset_ms))
+    assert _elapsed(lambda: limiter.acquire('POST', '/v2/private/order/cancel')) < 0.1
+
+def test_ban_expires_without_known_limit():
+    limiter = RateLimiter()
+    limiter._BAN_SEC = 0.3
+    limiter.update('GET', '/v2/private/order', _response(403))
+    assert 0.2 < _elapsed(lambda: limiter.acquire('GET', '/v2/private/order')) < 1.0
+    assert _elapsed(lambda: limiter.acquire('GET', '/v2/private/order')) < 0.1
+
+def test_ban_blocks_whole_group():
+    limiter = RateLimiter()
+    limiter._BAN_SEC = 0.3
+    limiter.update('GET', '/v2/private/order', _response(403))
+    assert 0.2 < _elapsed(lambda: limiter.acquire('GET', '/v2/private/execution/list')) < 1.0
+
+def test_cancel_before_queries_of_other_groups():
+    limiter = RateLimiter()
+    order = []
+    ticket = limiter._enter('order', RateLimiter._PRIORITY_CANCEL, ('POST', '/v2/private/order/cancel'))
+    thread = threading.Thread(target=lambda: (limiter.acquire('GET', '/v2/private/order/list'), order.append('query')))
+    thread.start()
+    time.sleep(0.2)
+    assert order == []
+    limiter._leave('order', ticket)
+    thread.join(1.0)
+    assert order == ['query']
+
+def test_group_from_spec():
+    assert RateLimiter.group('POST', '/v2/private/order/create') == 'order'
+    assert RateLimiter.group('GET', '/v2/private/order/list') == 'private'
+    assert RateLimiter.group('GET', '/v2/public/tickers') == 'public'
+    assert RateLimiter.group('POST', '/private/linear/position/set-leverage') == 'position'
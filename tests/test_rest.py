@@ -0,0 +1,48 @@
+from decimal import Decimal
+import pytest
+from pybybit.rest import Inverse, Linear
+
+def _contract(cls):
+    sent = []
+    return cls(lambda method, path, query, private: sent.append(query)), sent
+
+def test_numeric_types_accepted():
+    linear, sent = _contract(Linear)
+    linear.private_order_create(side='Buy', symbol='BTCUSDT', order_type='Limit', qty=Decimal('0.01'), price=Decimal('100.5'))
+    linear.private_order_create(side='Buy', symbol='BTCUSDT', order_type='Limit', qty='0.01', price=100)
+    assert sent[0]['price'] == Decimal('100.5') and sent[1]['price'] == 100
+
+def test_integral_values_accepted_for_int():
+    inverse, sent = _contract(Inverse)
+    for qty in (1, 1.0, '1', Decimal('2')):
+        inverse.private_order_create(side='Buy', symbol='BTCUSD', order_type='Market', qty=qty)
+    assert [q['qty'] for q in sent] == [1, 1.0, '1', Decimal('2')]
+
+def test_numpy_scalars_accepted():
+    np = pytest.importorskip('numpy')
+    inverse, sent = _contract(Inverse)
+    inverse.private_order_create(side='Buy', symbol='BTCUSD', order_type='Limit', qty=np.int64(3), price=np.float64(100.5))
+    assert len(sent) == 1
+
+@pytest.mark.parametrize('kwargs', [
+    {'qty': 1.5},
+    {'qty': 'x'},
+    {'price': 'abc'},
+    {'reduce_only': 'yes'},
+    {'symbol': ['BTCUSD']},
+])
+def test_invalid_values_rejected(kwargs):
+    inverse, sent = _contract(Inverse)
+    with pytest.raises(TypeError):
+        inverse.private_order_create(**kwargs)
+    assert sent == []
+
+def test_unknown_keyword_rejected():
+    inverse, _ = _contract(Inverse)
+    with pytest.raises(TypeError):
+        inverse.public_tickers(sym='BTCUSD')
+
+def test_keyword_param_renamed():
+    inverse, sent = _contract(Inverse)
+    inverse.public_kline_list(symbol='BTCUSD', interval='1', from_=1600000000)
+    assert sent[0]['from'] == 1600000000
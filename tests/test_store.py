@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+from pybybit.util import codec
+from pybybit.util.store import DataStore
+
+def _message(content: dict) -> codec.Message:
+    return codec.Message(json.dumps(content))
+
+def test_stoporder_does_not_modify_shared_message():
+    msg = _message({'topic': 'stop_order', 'data': [
+        {'order_id': 'a', 'order_status': 'Untriggered', 'symbol': 'BTCUSD'},
+    ]})
+    store = DataStore()
+    store.onmessage(msg, None)
+    assert msg.data == [{'order_id': 'a', 'order_status': 'Untriggered', 'symbol': 'BTCUSD'}]
+    assert store.stoporder.get(stop_order_id='a')['stop_order_status'] == 'Untriggered'
+
+def test_orderbook_delta_does_not_modify_earlier_message():
+    snapshot = _message({'topic': 'orderBook_200.100ms.BTCUSD', 'type': 'snapshot', 'data': [
+        {'price': '100', 'symbol': 'BTCUSD', 'id': 1, 'side': 'Buy', 'size': 1},
+    ]})
+    delta = _message({'topic': 'orderBook_200.100ms.BTCUSD', 'type': 'delta', 'data': {
+        'delete': [], 'insert': [],
+        'update': [{'price': '100', 'symbol': 'BTCUSD', 'id': 1, 'side': 'Buy', 'size': 5}],
+    }})
+    store = DataStore()
+    store.onmessage(snapshot, None)
+    store.onmessage(delta, None)
+    assert snapshot.data[0]['size'] == 1
+    assert store.orderbook.getbest('BTCUSD')['Buy']['size'] == 5
+
+def test_kline_does_not_modify_shared_message():
+    msg = _message({'topic': 'klineV2.1.BTCUSD', 'data': [{'start': 1, 'close': 2}]})
+    store = DataStore()
+    store.onmessage(msg, None)
+    assert 'symbol' not in msg.data[0]
+    assert store.kline.get(symbol='BTCUSD', start=1)['close'] == 2
+
+def test_callbacks_after_store_see_original_frame():
+    raw = json.dumps({'topic': 'stop_order', 'data': [{'order_id': 'a', 'order_status': 'Untriggered'}]})
+    msg = codec.Message(raw)
+    DataStore().onmessage(msg, None)
+    assert msg.content == json.loads(raw)
+
+def test_submodules_resolve_lazily():
+    code = (
+        'import pybybit\n'
+        'assert pybybit.rest.RESTAPI is pybybit.RESTAPI\n'
+        'assert pybybit.util.store.DataStore is pybybit.DataStore\n'
+        'for name in ("nosuch", "_private"):\n'
+        '    try:\n'
+        '        getattr(pybybit, name)\n'
+        '    except AttributeError:\n'
+        '        pass\n'
+        '    else:\n'
+        '        raise AssertionError(name)\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)